@@ -1,6 +1,7 @@
 """Code analysis modules for Program Mill."""
 
 from .language_detector import LanguageDetector, detect_language
+from .common import parse_cached
 from .ast_parser import (
     BUILTINS,
     ASTNodeBuilder,
@@ -12,6 +13,7 @@ from .ast_parser import (
 from .complexity import (
     compute_cyclomatic_complexity,
     compute_cognitive_complexity,
+    compute_function_complexities,
     compute_maintainability_index,
     enrich_function_with_complexity,
 )
@@ -37,6 +39,7 @@ from .invariants import (
 )
 from .security_boundaries import (
     SecurityBoundary,
+    analyze_boundaries,
     identify_input_boundaries,
     identify_output_boundaries,
     identify_privilege_boundaries,
@@ -59,9 +62,11 @@ __all__ = [
     "get_function_ast_node",
     "get_function_source",
     "parse_python_file",
+    "parse_cached",
     # Complexity analysis
     "compute_cyclomatic_complexity",
     "compute_cognitive_complexity",
+    "compute_function_complexities",
     "compute_maintainability_index",
     "enrich_function_with_complexity",
     # Control flow
@@ -96,6 +101,7 @@ __all__ = [
     "generate_invariant_report",
     # Security boundaries
     "SecurityBoundary",
+    "analyze_boundaries",
     "identify_input_boundaries",
     "identify_output_boundaries",
     "identify_privilege_boundaries",
@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from backend.analysis.common import parse_cached
 from backend.models import (
     ASTNode,
     ClassInfo,
@@ -564,7 +565,11 @@ def build_code_structure(source_code: str) -> CodeStructure:
         SyntaxError: If source code has syntax errors
     """
     try:
-        tree = ast.parse(source_code)
+        # Share the memoized tree with the critics run on the same source;
+        # on failure, parse again only to raise the detailed SyntaxError
+        tree = parse_cached(source_code)
+        if tree is None:
+            tree = ast.parse(source_code)
         source_lines = source_code.splitlines()
 
         # Extract functions
@@ -0,0 +1,85 @@
+"""Shared helpers for the analysis critics."""
+
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# Sources shorter than this (after stripping) are checked for trivially
+# having no function definitions before being parsed
+MIN_CODE_LEN = 16
+
+
+def _is_trivial_source(source_code: str) -> bool:
+    """
+    Check whether source is too small to hold any function definition.
+
+    The logic and maintainability critics and the test generator only
+    report on function definitions, so such sources can skip parsing
+    entirely.
+
+    Args:
+        source_code: Python source code
+
+    Returns:
+        True if the source is blank, or short and free of the def keyword
+    """
+    stripped = source_code.strip()
+    return not stripped or (len(stripped) < MIN_CODE_LEN and "def" not in stripped)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_cached(source_code: str) -> Optional[ast.Module]:
+    """
+    Parse source code, memoizing the tree per distinct source string.
+
+    The returned tree is shared between callers and must not be mutated.
+    Syntax errors are cached too: the None result is memoized, so a
+    known-bad source is not re-parsed and re-raised on later calls.
+
+    Args:
+        source_code: Python source code
+
+    Returns:
+        Parsed module, or None if the source has a syntax error
+    """
+    try:
+        return ast.parse(source_code)
+    except SyntaxError:
+        return None
+
+
+def _fingerprint(text: str) -> int:
+    """
+    Compute a 64-bit content fingerprint of a text in one pass.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        64-bit integer digest; equal texts always share a fingerprint
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+# Issue type -> positions of matching issues in report["issues"]
+IssueIndex = Dict[str, List[int]]
+
+
+def _index_by_type(issues: Sequence[Any]) -> IssueIndex:
+    """
+    Map each issue type to the positions of its issues.
+
+    Args:
+        issues: LogicIssue, MaintainabilityIssue or similar objects
+
+    Returns:
+        Dict of issue type to positions, keyed in first-occurrence order
+    """
+    index: IssueIndex = {}
+    for pos, issue in enumerate(issues):
+        index.setdefault(issue.issue_type, []).append(pos)
+    return index
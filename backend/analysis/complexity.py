@@ -1,10 +1,11 @@
 """Code complexity metrics calculation."""
 
 import ast
-from typing import List
+from typing import Dict, List, Tuple
 
 import radon.complexity as radon_cc
 from radon.metrics import mi_visit
+from radon.visitors import Function as RadonFunction
 
 import structlog
 
@@ -34,6 +35,33 @@ def compute_cyclomatic_complexity(source_code: str) -> int:
         return 0
 
 
+def compute_function_complexities(source_code: str) -> Dict[Tuple[str, int], int]:
+    """
+    Compute the cyclomatic complexity of every function in one radon pass.
+
+    Args:
+        source_code: Python source code
+
+    Returns:
+        Dict mapping (function name, def line) to cyclomatic complexity; the
+        key matches FunctionInfo (name, line_start), so same-named methods
+        in different classes stay distinct
+    """
+    try:
+        blocks = radon_cc.cc_visit(source_code)
+    except Exception as e:
+        logger.warning("cyclomatic_complexity_failed", error=str(e))
+        return {}
+
+    complexities: Dict[Tuple[str, int], int] = {}
+    pending = [block for block in blocks if isinstance(block, RadonFunction)]
+    while pending:
+        block = pending.pop()
+        complexities[block.name, block.lineno] = block.complexity
+        pending.extend(block.closures)
+    return complexities
+
+
 def compute_cognitive_complexity(source_code: str) -> int:
     """
     Compute cognitive complexity.
@@ -1,6 +1,9 @@
 """Automatic programming language detection for code analysis."""
 
+import re
+
 import structlog
+from pygments.lexer import Lexer
 from pygments.lexers import get_lexer_by_name, guess_lexer
 from pygments.util import ClassNotFound
 
@@ -38,6 +41,54 @@ LANGUAGE_MAPPING = {
 # Supported languages for analysis (Phase 1: Python only)
 SUPPORTED_LANGUAGES = {"python"}
 
+# Inputs shorter than this are classified by cheap signals before guess_lexer
+SHORT_INPUT_THRESHOLD = 1024
+
+# Number of leading characters inspected for cheap signals
+SIGNAL_WINDOW = 500
+
+# Signature regexes per lexer alias, compiled once at import. Each
+# matching signature adds one point to that language's score. Python
+# signatures are anchored to Python-only syntax (colon-terminated headers,
+# ES-incompatible imports, decorators on def/class) so TypeScript and
+# JavaScript imports, decorators and typed signatures do not score.
+_PYTHON_SIGNATURES = tuple(
+    re.compile(p, re.MULTILINE)
+    for p in (
+        r"^\s*(?:async\s+)?def\s+\w+\s*\(",
+        r"\)\s*(?:->\s*[^:\n]+)?:\s*(?:#.*)?$"
+        r"|^\s*(?:async\s+)?def\s+\w+\s*\([^)\n]*\)\s*(?:->\s*[^:\n]+)?:",
+        r"^\s*(?:from\s+[\w.]+\s+import\s+[\w(*]"
+        r"|import\s+[\w.]+(?:\s+as\s+\w+)?(?:\s*,\s*[\w.]+(?:\s+as\s+\w+)?)*\s*$)",
+        r"^\s*@[\w.]+.*\n(?:\s*@.*\n)*\s*(?:(?:async\s+)?def\s|class\s+\w+\s*(?:\([^)]*\))?\s*:)",
+    )
+)
+_GO_SIGNATURES = tuple(
+    re.compile(p, re.MULTILINE)
+    for p in (
+        r"^\s*package\s+\w+\s*$",
+        r"^\s*func\s+(?:\([^)]*\)\s*)?\w+\s*\(",
+        r"^\s*import\s+[\"(]",
+    )
+)
+_RUST_SIGNATURES = tuple(
+    re.compile(p, re.MULTILINE)
+    for p in (
+        r"^\s*(?:pub\s+)?fn\s+\w+",
+        r"\b\w+!\(",
+        r"^\s*(?:let\s+(?:mut\s+)?\w+|use\s+\w+::)",
+    )
+)
+
+LANGUAGE_SIGNATURES: tuple[tuple[str, tuple[re.Pattern[str], ...]], ...] = (
+    ("python", _PYTHON_SIGNATURES),
+    ("go", _GO_SIGNATURES),
+    ("rust", _RUST_SIGNATURES),
+)
+
+# Minimum signature score before a language is accepted without guess_lexer
+MIN_SIGNATURE_SCORE = 2
+
 
 class LanguageDetector:
     """Automatic programming language detection."""
@@ -76,8 +127,12 @@ class LanguageDetector:
                 except ClassNotFound:
                     pass  # Fall through to content-based detection
 
-            # Content-based detection using Pygments
-            lexer = guess_lexer(code)
+            # Cheap signal pass for short inputs avoids running every
+            # lexer's analyse_text via guess_lexer
+            lexer = LanguageDetector._match_cheap_signals(code)
+            if lexer is None:
+                # Content-based detection using Pygments
+                lexer = guess_lexer(code)
             detected = lexer.name.lower()
             normalized = LANGUAGE_MAPPING.get(detected, detected)
 
@@ -98,6 +153,36 @@ class LanguageDetector:
             )
             return "unknown"
 
+    @staticmethod
+    def _match_cheap_signals(code: str) -> Lexer | None:
+        """
+        Classify short inputs by precompiled signature regexes.
+
+        Args:
+            code: Source code to analyze
+
+        Returns:
+            Lexer for the highest-scoring language, or None to fall back
+            to guess_lexer
+        """
+        if len(code) >= SHORT_INPUT_THRESHOLD:
+            return None
+
+        head = code[:SIGNAL_WINDOW]
+        best_alias = None
+        best_score = MIN_SIGNATURE_SCORE - 1
+        for alias, signatures in LANGUAGE_SIGNATURES:
+            score = 0
+            for pattern in signatures:
+                if pattern.search(head):
+                    score += 1
+            if score > best_score:
+                best_alias, best_score = alias, score
+
+        if best_alias is None:
+            return None
+        return get_lexer_by_name(best_alias)
+
     @staticmethod
     def is_supported(language: str) -> bool:
         """
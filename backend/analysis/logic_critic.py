@@ -11,17 +11,20 @@ This module checks for:
 from __future__ import annotations
 
 import ast
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import structlog
 
+from backend.analysis.common import _index_by_type, _is_trivial_source, parse_cached
 from backend.models import FunctionInfo
 
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LogicIssue:
     """A logic issue found by the critic."""
 
@@ -33,6 +36,13 @@ class LogicIssue:
     suggestion: Optional[str] = None
     confidence: str = "medium"
 
+    def __post_init__(self) -> None:
+        # Categorical fields come from a small fixed vocabulary; interning
+        # shares one string object per label across all issues
+        object.__setattr__(self, "issue_type", sys.intern(self.issue_type))
+        object.__setattr__(self, "severity", sys.intern(self.severity))
+        object.__setattr__(self, "confidence", sys.intern(self.confidence))
+
 
 @dataclass
 class PreconditionCheck:
@@ -44,7 +54,7 @@ class PreconditionCheck:
     is_checked: bool
 
 
-class LogicCritic(ast.NodeVisitor):
+class LogicCritic:
     """Critic code for logical issues."""
 
     def __init__(self, source_code: str) -> None:
@@ -59,16 +69,38 @@ class LogicCritic(ast.NodeVisitor):
         self.checked_vars: Set[str] = set()
         self.assigned_vars: Dict[str, int] = {}  # var -> line assigned
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definition."""
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
-        old_function = self.current_function
+    def visit(self, tree: ast.AST) -> None:
+        """
+        Walk the tree once in ast.NodeVisitor's pre-order.
+
+        Nodes are dispatched by type identity instead of a visit_* method
+        lookup per node. Class/function context is restored by
+        (attribute, old value) markers pushed beneath each node's children.
+        """
+        stack: List[Any] = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+
+            if node_type is tuple:
+                setattr(self, node[0], node[1])
+                continue
+
+            if node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                stack.append(("current_function", self.current_function))
+                self._enter_function(node)
+            elif node_type is ast.ClassDef:
+                stack.append(("current_class", self.current_class))
+                self.current_class = node.name
+            elif node_type is ast.Compare:
+                self._track_compare(node)
+            elif node_type is ast.Assign:
+                self._track_assign(node)
+
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    def _enter_function(self, node: ast.FunctionDef) -> None:
+        """Set function context and run the per-function checks."""
         self.current_function = f"{self.current_class}.{node.name}" if self.current_class else node.name
 
         # Analyze function for logical issues
@@ -78,14 +110,7 @@ class LogicCritic(ast.NodeVisitor):
         self._check_array_bounds(node)
         self._check_unreachable_code(node)
 
-        self.generic_visit(node)
-        self.current_function = old_function
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Visit async function definition."""
-        self.visit_FunctionDef(node)
-
-    def visit_Compare(self, node: ast.Compare) -> None:
+    def _track_compare(self, node: ast.Compare) -> None:
         """Track comparison checks."""
         # Track variables being compared for None
         if isinstance(node.ops, list) and len(node.ops) > 0:
@@ -97,16 +122,12 @@ class LogicCritic(ast.NodeVisitor):
                     elif isinstance(node.comparators[0], ast.NameConstant):  # Python 3.8+
                         self.checked_vars.add(node.left.id)
 
-        self.generic_visit(node)
-
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def _track_assign(self, node: ast.Assign) -> None:
         """Track variable assignments."""
         for target in node.targets:
             if isinstance(target, ast.Name):
                 self.assigned_vars[target.id] = node.lineno
 
-        self.generic_visit(node)
-
     def _check_preconditions(self, node: ast.FunctionDef) -> None:
         """Check if preconditions are verified."""
         # Look for Optional parameters that aren't checked
@@ -254,7 +275,7 @@ class LogicCritic(ast.NodeVisitor):
 def analyze_logic_issues(
     source_code: str,
     functions: List[FunctionInfo],
-) -> List[LogicIssue]:
+) -> Tuple[LogicIssue, ...]:
     """
     Analyze code for logical issues.
 
@@ -263,17 +284,19 @@ def analyze_logic_issues(
         functions: List of functions to analyze
 
     Returns:
-        List of LogicIssue objects
+        Tuple of LogicIssue objects (the empty-tuple singleton if none)
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return []
+    if _is_trivial_source(source_code):
+        return ()
+
+    tree = parse_cached(source_code)
+    if tree is None:
+        return ()
 
     critic = LogicCritic(source_code)
     critic.visit(tree)
 
-    return critic.issues
+    return tuple(critic.issues)
 
 
 def check_preconditions_verified(
@@ -292,9 +315,8 @@ def check_preconditions_verified(
     """
     checks: List[PreconditionCheck] = []
 
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
     # Find the function node
@@ -352,9 +374,8 @@ def check_postconditions_established(
     """
     issues: List[LogicIssue] = []
 
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
     # Find the function node
@@ -390,7 +411,7 @@ def check_postconditions_established(
 
 
 def generate_logic_report(
-    logic_issues: List[LogicIssue],
+    logic_issues: Sequence[LogicIssue],
     preconditions: List[PreconditionCheck],
 ) -> dict:
     """
@@ -403,15 +424,10 @@ def generate_logic_report(
     Returns:
         Dict with summary and details
     """
-    # Count by issue type
-    type_counts: Dict[str, int] = {}
-    for issue in logic_issues:
-        type_counts[issue.issue_type] = type_counts.get(issue.issue_type, 0) + 1
-
-    # Count by severity
-    severity_counts: Dict[str, int] = {}
-    for issue in logic_issues:
-        severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+    # One pass builds the type index; type counts fall out of its lengths
+    type_index = _index_by_type(logic_issues)
+    type_counts = {issue_type: len(positions) for issue_type, positions in type_index.items()}
+    severity_counts = dict(Counter(issue.severity for issue in logic_issues))
 
     # Count precondition checks
     total_preconditions = len(preconditions)
@@ -426,6 +442,7 @@ def generate_logic_report(
             "by_issue_type": type_counts,
             "by_severity": severity_counts,
         },
+        "by_type_index": type_index,
         "issues": [
             {
                 "type": issue.issue_type,
@@ -14,18 +14,29 @@ from __future__ import annotations
 
 import ast
 import re
+import sys
+from collections import Counter
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import List, Optional, Set, Tuple
+from typing import Any, List, Optional, Sequence, Set, Tuple
 
 import structlog
 
+from backend.analysis.common import (
+    _fingerprint,
+    _index_by_type,
+    _is_trivial_source,
+    parse_cached,
+)
 from backend.models import FunctionInfo
 
 logger = structlog.get_logger()
 
+# Statements that add a level of nesting
+_NESTING_NODES = (ast.If, ast.For, ast.While, ast.With, ast.Try, ast.Match)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MaintainabilityIssue:
     """A maintainability issue found by the critic."""
 
@@ -37,8 +48,15 @@ class MaintainabilityIssue:
     suggestion: Optional[str] = None
     confidence: str = "medium"
 
+    def __post_init__(self) -> None:
+        # Categorical fields come from a small fixed vocabulary; interning
+        # shares one string object per label across all issues
+        object.__setattr__(self, "issue_type", sys.intern(self.issue_type))
+        object.__setattr__(self, "severity", sys.intern(self.severity))
+        object.__setattr__(self, "confidence", sys.intern(self.confidence))
+
 
-class MaintainabilityCritic(ast.NodeVisitor):
+class MaintainabilityCritic:
     """Detect maintainability issues in code."""
 
     def __init__(self, source_code: str) -> None:
@@ -51,16 +69,34 @@ class MaintainabilityCritic(ast.NodeVisitor):
         # Track function bodies for duplication detection
         self.function_bodies: List[Tuple[str, str, int, int]] = []  # (name, body, start, end)
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit class definition."""
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
+    def visit(self, tree: ast.AST) -> None:
+        """
+        Walk the tree once in ast.NodeVisitor's pre-order.
+
+        Nodes are dispatched by type identity instead of a visit_* method
+        lookup per node. Class/function context is restored by
+        (attribute, old value) markers pushed beneath each node's children.
+        """
+        stack: List[Any] = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+
+            if node_type is tuple:
+                setattr(self, node[0], node[1])
+                continue
+
+            if node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                stack.append(("current_function", self.current_function))
+                self._enter_function(node)
+            elif node_type is ast.ClassDef:
+                stack.append(("current_class", self.current_class))
+                self.current_class = node.name
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit function definition."""
-        old_function = self.current_function
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    def _enter_function(self, node: ast.FunctionDef) -> None:
+        """Set function context and run the per-function checks."""
         self.current_function = f"{self.current_class}.{node.name}" if self.current_class else node.name
 
         # Store function body for duplication analysis
@@ -75,13 +111,6 @@ class MaintainabilityCritic(ast.NodeVisitor):
         self._check_magic_numbers(node)
         self._check_poor_naming(node)
 
-        self.generic_visit(node)
-        self.current_function = old_function
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Visit async function definition."""
-        self.visit_FunctionDef(node)
-
     def _extract_function_body(self, node: ast.FunctionDef) -> str:
         """Extract function body as text."""
         try:
@@ -203,16 +232,18 @@ class MaintainabilityCritic(ast.NodeVisitor):
         """Calculate maximum nesting depth in function."""
         max_depth = 0
 
-        def _depth(n: ast.AST, current: int) -> None:
-            nonlocal max_depth
-            max_depth = max(max_depth, current)
-            for child in ast.iter_child_nodes(n):
-                if isinstance(child, (ast.If, ast.For, ast.While, ast.With, ast.Try, ast.Match)):
-                    _depth(child, current + 1)
+        # Iterative walk over (node, depth) pairs instead of recursion
+        stack: List[Tuple[ast.AST, int]] = [(node, 0)]
+        while stack:
+            current, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            for child in ast.iter_child_nodes(current):
+                if isinstance(child, _NESTING_NODES):
+                    stack.append((child, depth + 1))
                 else:
-                    _depth(child, current)
+                    stack.append((child, depth))
 
-        _depth(node, 0)
         return max_depth
 
     def _check_missing_docstring(self, node: ast.FunctionDef) -> None:
@@ -307,15 +338,31 @@ def _detect_code_duplication(function_bodies: List[Tuple[str, str, int, int]]) -
     """Detect duplicated code blocks."""
     issues: List[MaintainabilityIssue] = []
 
-    # Compare each function body with each other
-    for i, (name1, body1, start1, end1) in enumerate(function_bodies):
-        for name2, body2, start2, end2 in function_bodies[i + 1:]:
-            # Skip if bodies are too short
-            if len(body1) < 50 or len(body2) < 50:
-                continue
-
-            # Calculate similarity
-            similarity = SequenceMatcher(None, body1, body2).ratio()
+    # Skip bodies that are too short to analyze
+    candidates = [entry for entry in function_bodies if len(entry[1]) >= 50]
+    if len(candidates) < 2:
+        return issues
+
+    # Fingerprint each body once so exact copies skip SequenceMatcher
+    fingerprints = [_fingerprint(body) for _, body, _, _ in candidates]
+
+    # Compare every pair; the exact bounds below only skip SequenceMatcher
+    # for pairs whose ratio provably cannot exceed 0.8
+    for i, (name1, body1, start1, _) in enumerate(candidates):
+        for j in range(i + 1, len(candidates)):
+            name2, body2, start2, _ = candidates[j]
+
+            if fingerprints[i] == fingerprints[j] and body1 == body2:
+                similarity = 1.0
+            else:
+                # ratio() <= 2 * min(len) / total length (real_quick_ratio)
+                length = len(body1) + len(body2)
+                if 2.0 * min(len(body1), len(body2)) / length <= 0.8:
+                    continue
+                matcher = SequenceMatcher(None, body1, body2)
+                if matcher.quick_ratio() <= 0.8:
+                    continue
+                similarity = matcher.ratio()
 
             if similarity > 0.8:
                 issues.append(
@@ -337,7 +384,7 @@ def _detect_code_duplication(function_bodies: List[Tuple[str, str, int, int]]) -
 def analyze_maintainability_issues(
     source_code: str,
     functions: List[FunctionInfo],
-) -> List[MaintainabilityIssue]:
+) -> Tuple[MaintainabilityIssue, ...]:
     """
     Analyze code for maintainability issues.
 
@@ -346,12 +393,14 @@ def analyze_maintainability_issues(
         functions: List of functions to analyze
 
     Returns:
-        List of MaintainabilityIssue objects
+        Tuple of MaintainabilityIssue objects (the empty-tuple singleton if none)
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return []
+    if _is_trivial_source(source_code):
+        return ()
+
+    tree = parse_cached(source_code)
+    if tree is None:
+        return ()
 
     critic = MaintainabilityCritic(source_code)
     critic.visit(tree)
@@ -360,28 +409,23 @@ def analyze_maintainability_issues(
     duplication_issues = _detect_code_duplication(critic.function_bodies)
     critic.issues.extend(duplication_issues)
 
-    return critic.issues
+    return tuple(critic.issues)
 
 
-def generate_maintainability_report(issues: List[MaintainabilityIssue]) -> dict:
+def generate_maintainability_report(issues: Sequence[MaintainabilityIssue]) -> dict:
     """
     Generate maintainability analysis report.
 
     Args:
-        issues: List of maintainability issues
+        issues: Maintainability issues
 
     Returns:
         Dict with summary and details
     """
-    # Count by issue type
-    type_counts: dict[str, int] = {}
-    for issue in issues:
-        type_counts[issue.issue_type] = type_counts.get(issue.issue_type, 0) + 1
-
-    # Count by severity
-    severity_counts: dict[str, int] = {}
-    for issue in issues:
-        severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+    # One pass builds the type index; type counts fall out of its lengths
+    type_index = _index_by_type(issues)
+    type_counts = {issue_type: len(positions) for issue_type, positions in type_index.items()}
+    severity_counts = dict(Counter(issue.severity for issue in issues))
 
     return {
         "summary": {
@@ -389,6 +433,7 @@ def generate_maintainability_report(issues: List[MaintainabilityIssue]) -> dict:
             "by_type": type_counts,
             "by_severity": severity_counts,
         },
+        "by_type_index": type_index,
         "issues": [
             {
                 "type": issue.issue_type,
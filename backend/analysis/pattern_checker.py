@@ -3,10 +3,13 @@
 Each check is a pure function: FunctionFacts -> Optional[VerificationIssue]
 """
 
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence
 
 from backend.models import FindingConfidence, FindingTier, FunctionFacts, VerificationIssue
 
+# Signature shared by every Tier 2 check
+Tier2Check = Callable[[FunctionFacts], Optional[VerificationIssue]]
+
 
 def check_bare_except(facts: FunctionFacts) -> Optional[VerificationIssue]:
     """
@@ -316,6 +319,9 @@ def check_giant_function(facts: FunctionFacts) -> Optional[VerificationIssue]:
     LOC_THRESHOLD = 50
     COMPLEXITY_THRESHOLD = 10
 
+    # Both metrics are precomputed by extract_function_facts (loc is the
+    # line-span difference), so this check is two integer comparisons with
+    # no per-line loop; it does not need JIT compilation or vectorizing.
     reasons = []
     if facts.loc > LOC_THRESHOLD:
         reasons.append(f"{facts.loc} lines (threshold: {LOC_THRESHOLD})")
@@ -344,7 +350,11 @@ def check_giant_function(facts: FunctionFacts) -> Optional[VerificationIssue]:
         suggested_fix=(
             "Consider splitting the function into smaller helper functions "
             "or reduce nesting levels."
-        )
+        ),
+        metadata={
+            "loc": facts.loc,
+            "cyclomatic_complexity": facts.cyclomatic_complexity,
+        }
     )
 
 
@@ -469,7 +479,7 @@ def check_shadow_builtin(facts: FunctionFacts) -> Optional[VerificationIssue]:
 
 
 # All Tier 2 checks - run in sequence
-TIER2_CHECKS = [
+TIER2_CHECKS: List[Tier2Check] = [
     check_bare_except,
     check_mutable_defaults,
     check_resource_leak,
@@ -483,18 +493,25 @@ TIER2_CHECKS = [
 ]
 
 
-def run_tier2_checks(facts: FunctionFacts) -> List[VerificationIssue]:
+def run_tier2_checks(
+    facts: FunctionFacts,
+    checks: Optional[Sequence[Tier2Check]] = None,
+) -> List[VerificationIssue]:
     """
     Run all Tier 2 pattern checks on a function.
 
     Args:
         facts: Extracted function facts from AST analysis
+        checks: Checks to run instead of TIER2_CHECKS
 
     Returns:
         List of VerificationIssue objects (one for each check that found an issue)
     """
+    if checks is None:
+        checks = TIER2_CHECKS
+
     issues = []
-    for check in TIER2_CHECKS:
+    for check in checks:
         try:
             issue = check(facts)
             if issue:
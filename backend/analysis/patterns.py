@@ -12,10 +12,13 @@ import ast
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from itertools import combinations
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import structlog
 
+from backend.analysis.common import _fingerprint, parse_cached
 from backend.models import ClassInfo, FunctionInfo
 
 logger = structlog.get_logger()
@@ -374,6 +377,28 @@ class AntiPatternDetector(ast.NodeVisitor):
         return max_depth
 
 
+def _ratio_upper_bound(counts1: Counter, counts2: Counter, length: int) -> float:
+    """
+    Bound SequenceMatcher.ratio() from the character frequencies of two texts.
+
+    Matching blocks can only pair up equal characters, so the shared
+    character multiset caps the match count; this is the same bound as
+    SequenceMatcher.quick_ratio() without rebuilding the counts per pair.
+
+    Args:
+        counts1: Character counts of the first text
+        counts2: Character counts of the second text
+        length: Combined length of both texts
+
+    Returns:
+        Upper bound on the ratio, between 0.0 and 1.0
+    """
+    if not length:
+        return 1.0
+    matches = sum((counts1 & counts2).values())
+    return 2.0 * matches / length
+
+
 class DuplicateCodeDetector:
     """Detect duplicate code blocks."""
 
@@ -382,7 +407,14 @@ class DuplicateCodeDetector:
         self.duplicates: List[DuplicateCodeBlock] = []
 
     def detect_duplicates(self, functions: List[FunctionInfo], source_code: str) -> List[DuplicateCodeBlock]:
-        """Detect duplicate code across functions."""
+        """
+        Detect duplicate code across functions.
+
+        Every pair of functions is considered; pairs whose character counts
+        rule out reaching the threshold skip SequenceMatcher. Pairs are
+        scored before merging so one matcher can reuse its analysis of each
+        second body across all of that body's pairs.
+        """
         # Get function bodies
         function_bodies: List[Tuple[str, int, int, str]] = []  # (name, start, end, body)
 
@@ -393,31 +425,57 @@ class DuplicateCodeDetector:
             body = "\n".join(lines[start:end])
             function_bodies.append((func.name, func.line_start, func.line_end, body))
 
-        # Compare all pairs
+        # Fingerprint each body once so exact copies skip SequenceMatcher
+        fingerprints = [_fingerprint(body) for _, _, _, body in function_bodies]
+        pairs = list(combinations(range(len(function_bodies)), 2))
+
+        # Character frequencies per body, built once for the ratio bound
+        char_counts = [Counter(body) for _, _, _, body in function_bodies]
+
+        # Score pairs grouped by their second body: SequenceMatcher caches
+        # its analysis of seq2, so each body is indexed once, not per pair
+        similarities: Dict[Tuple[int, int], float] = {}
+        matcher = SequenceMatcher(None)
+        for i, j in sorted(pairs, key=itemgetter(1)):
+            body1 = function_bodies[i][3]
+            body2 = function_bodies[j][3]
+            if fingerprints[i] == fingerprints[j] and body1 == body2:
+                similarities[i, j] = 1.0
+            elif _ratio_upper_bound(
+                char_counts[i], char_counts[j], len(body1) + len(body2)
+            ) >= self.similarity_threshold:
+                # Otherwise SequenceMatcher.ratio() cannot reach the threshold
+                matcher.set_seq2(body2)
+                matcher.set_seq1(body1)
+                similarities[i, j] = matcher.ratio()
+
         duplicates: List[DuplicateCodeBlock] = []
-        for i, (name1, start1, end1, body1) in enumerate(function_bodies):
-            for name2, start2, end2, body2 in function_bodies[i+1:]:
-                similarity = SequenceMatcher(None, body1, body2).ratio()
-                if similarity >= self.similarity_threshold:
-                    # Check if this is already in our duplicates list
-                    found = False
-                    for dup in duplicates:
-                        if abs(dup.similarity - similarity) < 0.01:
-                            dup.locations.append((name2, start2, end2))
-                            found = True
-                            break
-
-                    if not found:
-                        duplicates.append(
-                            DuplicateCodeBlock(
-                                content=body1[:100] + "...",  # Truncated
-                                locations=[
-                                    (name1, start1, end1),
-                                    (name2, start2, end2),
-                                ],
-                                similarity=similarity,
-                            )
+        for i, j in pairs:
+            similarity = similarities.get((i, j))
+            if similarity is None:
+                continue
+            name1, start1, end1, body1 = function_bodies[i]
+            name2, start2, end2, _ = function_bodies[j]
+            if similarity >= self.similarity_threshold:
+                # Check if this is already in our duplicates list
+                found = False
+                for dup in duplicates:
+                    if abs(dup.similarity - similarity) < 0.01:
+                        dup.locations.append((name2, start2, end2))
+                        found = True
+                        break
+
+                if not found:
+                    duplicates.append(
+                        DuplicateCodeBlock(
+                            content=body1[:100] + "...",  # Truncated
+                            locations=[
+                                (name1, start1, end1),
+                                (name2, start2, end2),
+                            ],
+                            similarity=similarity,
                         )
+                    )
 
         self.duplicates = duplicates
         return duplicates
@@ -434,17 +492,38 @@ def detect_design_patterns(source_code: str, classes: List[ClassInfo]) -> List[P
     Returns:
         List of PatternMatch objects
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
-    source_lines = source_code.splitlines()
+    return detect_design_patterns_from_ast(tree, classes, source_code.splitlines())
+
+
+def detect_design_patterns_from_ast(
+    tree: ast.AST,
+    classes: List[ClassInfo],
+    source_lines: Optional[List[str]] = None,
+) -> List[PatternMatch]:
+    """
+    Detect design patterns in an already-parsed module.
+
+    Callers that hold a tree (or analyze the same snippet repeatedly)
+    skip the parse that detect_design_patterns would do. The tree is
+    only read, so shared cached trees are safe to pass.
+
+    Args:
+        tree: Parsed module AST
+        classes: List of classes to analyze
+        source_lines: Source lines of the module, if available
+
+    Returns:
+        List of PatternMatch objects
+    """
     matches: List[PatternMatch] = []
 
     # Run all pattern detectors
     detectors = [
-        SingletonPatternDetector(source_lines),
+        SingletonPatternDetector(source_lines or []),
         FactoryPatternDetector(),
         StrategyPatternDetector(),
         DecoratorPatternDetector(),
@@ -473,16 +552,18 @@ def detect_anti_patterns(
     Returns:
         Tuple of (anti_patterns, code_smells)
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    tree = parse_cached(source_code)
+    if tree is None:
         return [], []
 
     source_lines = source_code.splitlines()
     detector = AntiPatternDetector(source_code, source_lines)
     detector.visit(tree)
 
-    # Detect duplicate code
+    # Detect duplicate code; it needs at least one pair of functions
+    if len(functions) < 2:
+        return detector.anti_patterns, detector.code_smells
+
     duplicate_detector = DuplicateCodeDetector()
     duplicates = duplicate_detector.detect_duplicates(functions, source_code)
 
@@ -12,15 +12,32 @@ from __future__ import annotations
 
 import ast
 from dataclasses import dataclass
-from typing import List, Optional, Set
+from typing import Callable, ClassVar, Dict, List, Optional, Set
 
 import structlog
 
+from backend.analysis.common import parse_cached
 from backend.models import FunctionInfo
 
 logger = structlog.get_logger()
 
 
+_Handler = Callable[[ast.NodeVisitor, ast.AST], None]
+
+
+def _build_dispatch(cls: type) -> Dict[type, _Handler]:
+    """Map AST node types to the ``visit_*`` handlers a visitor class defines."""
+    dispatch: Dict[type, _Handler] = {}
+    for klass in reversed(cls.__mro__):
+        if klass in (object, ast.NodeVisitor):
+            continue
+        for name, handler in vars(klass).items():
+            node_type = getattr(ast, name[len("visit_"):], None) if name.startswith("visit_") else None
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                dispatch[node_type] = handler
+    return dispatch
+
+
 @dataclass
 class PerformanceIssue:
     """A performance issue found by the critic."""
@@ -37,6 +54,13 @@ class PerformanceIssue:
 class PerformanceCritic(ast.NodeVisitor):
     """Detect performance issues in code."""
 
+    # Node type -> handler, resolved once per class instead of per visited node
+    _DISPATCH: ClassVar[Dict[type, _Handler]] = {}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._DISPATCH = _build_dispatch(cls)
+
     def __init__(self, source_code: str) -> None:
         self.source_code = source_code
         self.source_lines = source_code.splitlines()
@@ -76,6 +100,14 @@ class PerformanceCritic(ast.NodeVisitor):
                     if descendant != child:
                         self._within_loop.add(descendant)
 
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node through the precomputed dispatch table."""
+        handler = self._DISPATCH.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(self, node)
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Visit class definition."""
         old_class = self.current_class
@@ -288,6 +320,9 @@ class PerformanceCritic(ast.NodeVisitor):
                 )
 
 
+PerformanceCritic._DISPATCH = _build_dispatch(PerformanceCritic)
+
+
 def analyze_performance_issues(
     source_code: str,
     functions: List[FunctionInfo],
@@ -302,9 +337,8 @@ def analyze_performance_issues(
     Returns:
         List of PerformanceIssue objects
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
     critic = PerformanceCritic(source_code)
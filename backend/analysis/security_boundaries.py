@@ -10,19 +10,22 @@ This module identifies:
 from __future__ import annotations
 
 import ast
-from collections import defaultdict
+import functools
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Dict, List, Optional, Set, Tuple
 
 import structlog
 
+from backend.analysis.common import parse_cached
 from backend.models import ClassInfo, FunctionInfo
 
 logger = structlog.get_logger()
 
 
-# Known sources of untrusted input
-UNTRUSTED_SOURCES = {
+# Known sources of untrusted input (matched as substrings of call names)
+UNTRUSTED_SOURCES = frozenset({
     "request",  # Flask/Django/etc HTTP request
     "flask.request",
     "HttpRequest",
@@ -35,19 +38,47 @@ UNTRUSTED_SOURCES = {
     "argv",  # Command line arguments
     "getattr",
     "__getitem__",
-}
+})
 
-# Known sink categories (where data flows)
+# Known sink categories (where data flows); checked in this order
 SINK_CATEGORIES = {
-    "database": ["execute", "executemany", "cursor.execute", "db.execute"],
-    "network": ["requests.", "urllib.", "http.client", "socket.send", "socket.sendto"],
-    "file": ["open(", "file.write", "Path.write", "os.remove", "os.unlink"],
-    "command": ["os.system", "subprocess.call", "subprocess.run", "subprocess.Popen"],
-    "eval": ["eval", "exec", "__import__"],
+    "database": ("execute", "executemany", "cursor.execute", "db.execute"),
+    "network": ("requests.", "urllib.", "http.client", "socket.send", "socket.sendto"),
+    "file": ("open(", "file.write", "Path.write", "os.remove", "os.unlink"),
+    "command": ("os.system", "subprocess.call", "subprocess.run", "subprocess.Popen"),
+    "eval": ("eval", "exec", "__import__"),
 }
 
+# Sink categories whose calls are always critical
+_CRITICAL_SINKS = frozenset({"command", "eval"})
 
-@dataclass
+# Builtins that execute dynamic code
+_DYNAMIC_EXEC_CALLS = frozenset({"eval", "exec", "__import__"})
+
+# Parameter annotations marking HTTP request objects
+_REQUEST_ANNOTATIONS = ("Request", "HttpRequest", "WebRequest")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_untrusted_source_name(func_name: str) -> bool:
+    """Check if a call name contains a known untrusted source.
+
+    Call names repeat heavily across a codebase, so the substring scan
+    over UNTRUSTED_SOURCES is memoized per name.
+    """
+    return any(source in func_name for source in UNTRUSTED_SOURCES)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sink_for_name(func_name: str) -> Tuple[Optional[str], str]:
+    """Return (sink_type, risk_level) for a call name, memoized per name."""
+    for sink_type, sinks in SINK_CATEGORIES.items():
+        if any(sink in func_name for sink in sinks):
+            return sink_type, "critical" if sink_type in _CRITICAL_SINKS else "medium"
+    return None, "low"
+
+
+@dataclass(slots=True)
 class SecurityBoundary:
     """A security boundary in the code."""
 
@@ -71,7 +102,7 @@ class DataFlow:
     vulnerabilities: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustLevel:
     """Trust level classification for data."""
 
@@ -112,7 +143,7 @@ class SecurityBoundaryAnalyzer(ast.NodeVisitor):
             # Check type hint for request types
             if arg.annotation:
                 annotation = ast.unparse(arg.annotation)
-                if any(source in annotation for source in ["Request", "HttpRequest", "WebRequest"]):
+                if any(source in annotation for source in _REQUEST_ANNOTATIONS):
                     self.boundaries.append(
                         SecurityBoundary(
                             boundary_type="input",
@@ -176,7 +207,7 @@ class SecurityBoundaryAnalyzer(ast.NodeVisitor):
             )
 
         # Check for eval/exec
-        if func_name in ["eval", "exec", "__import__"]:
+        if func_name in _DYNAMIC_EXEC_CALLS:
             self.boundaries.append(
                 SecurityBoundary(
                     boundary_type="privilege",
@@ -231,19 +262,11 @@ class SecurityBoundaryAnalyzer(ast.NodeVisitor):
 
     def _is_untrusted_source(self, func_name: str) -> bool:
         """Check if function is an untrusted source."""
-        return any(source in func_name for source in UNTRUSTED_SOURCES)
+        return _is_untrusted_source_name(func_name)
 
     def _check_sink(self, func_name: str) -> Tuple[Optional[str], str]:
         """Check if function is a sink and return (type, risk_level)."""
-        for sink_type, sinks in SINK_CATEGORIES.items():
-            if any(sink in func_name for sink in sinks):
-                if sink_type == "command":
-                    return sink_type, "critical"
-                elif sink_type == "eval":
-                    return sink_type, "critical"
-                else:
-                    return sink_type, "medium"
-        return None, "low"
+        return _sink_for_name(func_name)
 
     def _get_call_name(self, node: ast.Call) -> Optional[str]:
         """Get the name of a function call."""
@@ -254,6 +277,34 @@ class SecurityBoundaryAnalyzer(ast.NodeVisitor):
         return None
 
 
+def analyze_boundaries(
+    source_code: str,
+) -> Tuple[List[SecurityBoundary], Dict[str, TrustLevel]]:
+    """
+    Find all security boundaries and trust levels in one AST walk.
+
+    Use this instead of calling the identify_* functions and
+    classify_trust_levels separately, each of which walks the tree again.
+
+    Args:
+        source_code: Python source code
+
+    Returns:
+        Tuple of (boundaries of every type, variable trust levels)
+    """
+    if not source_code.strip():
+        return [], {}
+
+    tree = parse_cached(source_code)
+    if tree is None:
+        return [], {}
+
+    analyzer = SecurityBoundaryAnalyzer(source_code)
+    analyzer.visit(tree)
+
+    return analyzer.boundaries, analyzer.trust_levels
+
+
 def identify_input_boundaries(
     source_code: str,
     functions: List[FunctionInfo],
@@ -268,15 +319,8 @@ def identify_input_boundaries(
     Returns:
         List of SecurityBoundary objects for inputs
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return []
-
-    analyzer = SecurityBoundaryAnalyzer(source_code)
-    analyzer.visit(tree)
-
-    return [b for b in analyzer.boundaries if b.boundary_type == "input"]
+    boundaries, _ = analyze_boundaries(source_code)
+    return [b for b in boundaries if b.boundary_type == "input"]
 
 
 def identify_output_boundaries(
@@ -293,15 +337,8 @@ def identify_output_boundaries(
     Returns:
         List of SecurityBoundary objects for outputs
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return []
-
-    analyzer = SecurityBoundaryAnalyzer(source_code)
-    analyzer.visit(tree)
-
-    return [b for b in analyzer.boundaries if b.boundary_type == "output"]
+    boundaries, _ = analyze_boundaries(source_code)
+    return [b for b in boundaries if b.boundary_type == "output"]
 
 
 def identify_privilege_boundaries(
@@ -318,15 +355,8 @@ def identify_privilege_boundaries(
     Returns:
         List of SecurityBoundary objects for privilege escalations
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return []
-
-    analyzer = SecurityBoundaryAnalyzer(source_code)
-    analyzer.visit(tree)
-
-    return [b for b in analyzer.boundaries if b.boundary_type == "privilege"]
+    boundaries, _ = analyze_boundaries(source_code)
+    return [b for b in boundaries if b.boundary_type == "privilege"]
 
 
 def classify_trust_levels(
@@ -341,15 +371,8 @@ def classify_trust_levels(
     Returns:
         Dict mapping variable names to TrustLevel objects
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
-        return {}
-
-    analyzer = SecurityBoundaryAnalyzer(source_code)
-    analyzer.visit(tree)
-
-    return analyzer.trust_levels
+    _, trust_levels = analyze_boundaries(source_code)
+    return trust_levels
 
 
 def generate_boundary_report(
@@ -370,15 +393,14 @@ def generate_boundary_report(
     Returns:
         Dict with summary and details
     """
-    # Count by risk level
-    risk_counts = {"low": 0, "medium": 0, "high": 0, "critical": 0}
-    for boundary in input_boundaries + output_boundaries + privilege_boundaries:
-        risk_counts[boundary.risk_level] = risk_counts.get(boundary.risk_level, 0) + 1
+    # Count by risk level, always reporting the four standard levels
+    risk_counts = dict.fromkeys(("low", "medium", "high", "critical"), 0)
+    risk_counts.update(Counter(
+        b.risk_level for b in chain(input_boundaries, output_boundaries, privilege_boundaries)
+    ))
 
     # Count trust levels
-    trust_counts = defaultdict(int)
-    for var, level in trust_levels.items():
-        trust_counts[level.trust_level] += 1
+    trust_counts = Counter(level.trust_level for level in trust_levels.values())
 
     return {
         "summary": {
@@ -13,17 +13,19 @@ from __future__ import annotations
 
 import ast
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Optional
 
 import structlog
 
+from backend.analysis.common import parse_cached
 from backend.models import FunctionInfo
 
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityIssue:
     """A security vulnerability found."""
 
@@ -188,15 +190,20 @@ class SecurityCritic(ast.NodeVisitor):
                             )
 
 
+# Substrings hinting that an expression carries user input, fused into
+# one case-insensitive alternation (plain substring match, no word bounds)
+_USER_INPUT_PATTERNS = (
+    "request.", "input", "form.", "args.", "params.", "query", "body",
+    "user", "data", "json", "xml", "html",
+)
+_USER_INPUT_RE = re.compile(
+    "|".join(re.escape(p) for p in _USER_INPUT_PATTERNS), re.IGNORECASE
+)
+
+
 def _is_likely_user_input(expr: str) -> bool:
     """Check if expression is likely user input."""
-    user_input_patterns = [
-        "request.", "input", "form.", "args.", "params.", "query", "body",
-        "user", "data", "json", "xml", "html"
-    ]
-
-    expr_lower = expr.lower()
-    return any(pattern.lower() in expr_lower for pattern in user_input_patterns)
+    return _USER_INPUT_RE.search(expr) is not None
 
 
 def analyze_security_issues(
@@ -213,9 +220,13 @@ def analyze_security_issues(
     Returns:
         List of SecurityIssue objects
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    # Every check runs per function definition, so source without the def
+    # keyword cannot produce an issue and need not be parsed
+    if "def" not in source_code:
+        return []
+
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
     critic = SecurityCritic(source_code)
@@ -234,21 +245,14 @@ def generate_security_report(issues: List[SecurityIssue]) -> dict:
     Returns:
         Dict with summary and details
     """
-    # Count by vulnerability type
-    type_counts: dict[str, int] = {}
-    for issue in issues:
-        type_counts[issue.vuln_type] = type_counts.get(issue.vuln_type, 0) + 1
-
-    # Count by severity
-    severity_counts: dict[str, int] = {}
-    for issue in issues:
-        severity_counts[issue.severity] = severity_counts.get(issue.severity, 0) + 1
+    type_counts = Counter(issue.vuln_type for issue in issues)
+    severity_counts = Counter(issue.severity for issue in issues)
 
     return {
         "summary": {
             "total_issues": len(issues),
-            "by_type": type_counts,
-            "by_severity": severity_counts,
+            "by_type": dict(type_counts),
+            "by_severity": dict(severity_counts),
         },
         "issues": [
             {
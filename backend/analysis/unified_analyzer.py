@@ -15,12 +15,9 @@ from typing import Any, Dict, List
 import structlog
 
 from backend.analysis import (
+    analyze_boundaries,
     build_code_structure,
-    classify_trust_levels,
-    compute_cyclomatic_complexity,
-    identify_input_boundaries,
-    identify_output_boundaries,
-    identify_privilege_boundaries,
+    compute_function_complexities,
 )
 from backend.analysis.contracts import Contract, extract_contracts
 from backend.analysis.invariants import (
@@ -155,7 +152,7 @@ class UnifiedAnalyzer:
 
             # Security boundary analysis
             result.input_boundaries, result.output_boundaries, result.privilege_boundaries, result.trust_levels = (
-                self._analyze_security_boundaries(source_code, functions)
+                self._analyze_security_boundaries(source_code)
             )
 
             if not self.skip_patterns:
@@ -196,25 +193,22 @@ class UnifiedAnalyzer:
         if not functions:
             return metrics
 
+        # One radon pass for the whole module instead of one per function
+        complexities = compute_function_complexities(source_code)
+
         total_cc = 0
         for func in functions:
-            try:
-                cc = compute_cyclomatic_complexity(source_code)
-                if isinstance(cc, dict):
-                    # Take first CC value if available
-                    for name, value in cc.items():
-                        if isinstance(value, int):
-                            total_cc += value
-                            metrics["functions_analyzed"] += 1
-
-                            if value > 10:
-                                metrics["high_complexity_functions"].append({
-                                    "name": name,
-                                    "complexity": value,
-                                })
-                            break
-            except Exception:
-                pass
+            value = complexities.get((func.name, func.line_start))
+            if value is None:
+                continue
+            total_cc += value
+            metrics["functions_analyzed"] += 1
+
+            if value > 10:
+                metrics["high_complexity_functions"].append({
+                    "name": func.name,
+                    "complexity": value,
+                })
 
         if metrics["functions_analyzed"] > 0:
             metrics["avg_cyclomatic_complexity"] = total_cc / metrics["functions_analyzed"]
@@ -360,16 +354,12 @@ class UnifiedAnalyzer:
 
         return invariants
 
-    def _analyze_security_boundaries(
-        self,
-        source_code: str,
-        functions: List[FunctionInfo],
-    ) -> tuple:
+    def _analyze_security_boundaries(self, source_code: str) -> tuple:
         """Analyze security boundaries."""
-        input_bounds = identify_input_boundaries(source_code, functions)
-        output_bounds = identify_output_boundaries(source_code, functions)
-        privilege_bounds = identify_privilege_boundaries(source_code, functions)
-        trust_levels = classify_trust_levels(source_code)
+        boundaries, trust_levels = analyze_boundaries(source_code)
+        input_bounds = [b for b in boundaries if b.boundary_type == "input"]
+        output_bounds = [b for b in boundaries if b.boundary_type == "output"]
+        privilege_bounds = [b for b in boundaries if b.boundary_type == "privilege"]
 
         return (
             [
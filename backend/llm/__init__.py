@@ -1,10 +1,17 @@
 """LLM integration layer for Program Mill."""
 
-from .adapter import LLMAdapter, LLMError, StubLLMAdapter, FailingLLMAdapter
+from .adapter import (
+    LLMAdapter,
+    LLMError,
+    StubLLMAdapter,
+    FailingLLMAdapter,
+    is_async_adapter,
+)
 
 __all__ = [
     "LLMAdapter",
     "LLMError",
     "StubLLMAdapter",
     "FailingLLMAdapter",
+    "is_async_adapter",
 ]
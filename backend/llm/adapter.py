@@ -1,8 +1,10 @@
 """LLM adapter abstract interface and stub implementation for testing."""
 
 import asyncio
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from functools import cache
+from typing import Any, Dict, Optional, Tuple
 
 
 class LLMAdapter(ABC):
@@ -37,6 +39,23 @@ class LLMAdapter(ABC):
         pass
 
 
+@cache
+def is_async_adapter(adapter_type: type[LLMAdapter]) -> bool:
+    """
+    Check whether an adapter class implements complete() as a coroutine.
+
+    The answer depends only on the class, so it is cached per type rather
+    than re-inspecting the method on every call.
+
+    Args:
+        adapter_type: LLMAdapter subclass to check
+
+    Returns:
+        True if adapter_type.complete is a coroutine function
+    """
+    return inspect.iscoroutinefunction(adapter_type.complete)
+
+
 class LLMError(Exception):
     """Exception raised when LLM request fails."""
 
@@ -82,7 +101,8 @@ class StubLLMAdapter(LLMAdapter):
         self.default_response = default_response
         self.latency_seconds = latency_seconds
         self.call_count = 0
-        self.call_history: list[Dict[str, Any]] = []
+        # (prompt, kwargs) pairs; dict views are built on demand
+        self.call_history: list[Tuple[str, Dict[str, Any]]] = []
 
     async def complete(
         self,
@@ -103,10 +123,7 @@ class StubLLMAdapter(LLMAdapter):
         self.call_count += 1
 
         # Record call for test assertions
-        self.call_history.append({
-            "prompt": prompt,
-            "kwargs": kwargs,
-        })
+        self.call_history.append((prompt, kwargs))
 
         # Simulate latency if configured
         if self.latency_seconds > 0:
@@ -127,12 +144,13 @@ class StubLLMAdapter(LLMAdapter):
     def get_last_call(self) -> Optional[Dict[str, Any]]:
         """Get the most recent call to complete()."""
         if self.call_history:
-            return self.call_history[-1]
+            prompt, kwargs = self.call_history[-1]
+            return {"prompt": prompt, "kwargs": kwargs}
         return None
 
     def was_called_with(self, keyword: str) -> bool:
         """Check if complete() was called with a prompt containing the keyword."""
-        return any(keyword in call["prompt"] for call in self.call_history)
+        return any(keyword in prompt for prompt, _ in self.call_history)
 
 
 class FailingLLMAdapter(LLMAdapter):
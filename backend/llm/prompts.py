@@ -1,40 +1,46 @@
 """Prompt templates for LLM-assisted verification checks."""
 
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from backend.models import FunctionFacts
 
 
-def _build_param_list(facts: FunctionFacts) -> str:
+# (name, type_hint, has_default) for each parameter, as used by the prompt
+ParamKey = Tuple[str, Optional[str], bool]
+
+
+def _build_param_list(parameters: Tuple[ParamKey, ...]) -> str:
     """Build parameter list string for prompt."""
-    if not facts.parameters:
+    if not parameters:
         return "none"
 
     parts = []
-    for param in facts.parameters:
-        type_hint = param.type_hint or "no type hint"
-        default = "has default" if param.has_default else "no default"
-        parts.append(f"{param.name}: {type_hint}, {default}")
+    for name, type_hint, has_default in parameters:
+        type_hint = type_hint or "no type hint"
+        default = "has default" if has_default else "no default"
+        parts.append(f"{name}: {type_hint}, {default}")
 
     return "; ".join(parts)
 
 
-def _build_none_check_facts(facts: FunctionFacts) -> str:
+def _build_none_check_facts(has_none_checks: Tuple[str, ...]) -> str:
     """Build None check facts string for prompt."""
-    if not facts.has_none_checks:
+    if not has_none_checks:
         return "No None checks detected"
 
-    return f"Has None checks for: {', '.join(facts.has_none_checks)}"
+    return f"Has None checks for: {', '.join(has_none_checks)}"
 
 
-def _build_call_list(facts: FunctionFacts) -> str:
+def _build_call_list(calls: Tuple[str, ...]) -> str:
     """Build function call list for prompt."""
-    if not facts.calls:
+    if not calls:
         return "none"
 
     # Show first 10 calls only
-    calls = facts.calls[:10]
-    result = ", ".join(calls)
-    if len(facts.calls) > 10:
-        result += f" (and {len(facts.calls) - 10} more)"
+    result = ", ".join(calls[:10])
+    if len(calls) > 10:
+        result += f" (and {len(calls) - 10} more)"
     return result
 
 
@@ -85,11 +91,29 @@ def build_null_safety_prompt(facts: FunctionFacts) -> str:
     Returns:
         The formatted prompt string
     """
+    # FunctionFacts is mutable, so the cache is keyed on a snapshot of
+    # only the fields the prompt reads
+    return _render_null_safety_prompt(
+        facts.source_code,
+        tuple((p.name, p.type_hint, p.has_default) for p in facts.parameters),
+        tuple(facts.has_none_checks),
+        tuple(facts.calls),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _render_null_safety_prompt(
+    source_code: str,
+    parameters: Tuple[ParamKey, ...],
+    has_none_checks: Tuple[str, ...],
+    calls: Tuple[str, ...],
+) -> str:
+    """Format the null safety prompt from hashable fact fields."""
     return NULL_SAFETY_PROMPT.format(
-        function_code=facts.source_code,
-        param_list=_build_param_list(facts),
-        none_check_facts=_build_none_check_facts(facts),
-        call_list=_build_call_list(facts),
+        function_code=source_code,
+        param_list=_build_param_list(parameters),
+        none_check_facts=_build_none_check_facts(has_none_checks),
+        call_list=_build_call_list(calls),
     )
 
 
@@ -1,7 +1,58 @@
 """Response parsing utilities for LLM outputs."""
 
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+# Single verdict scan: an UNSAFE verdict with details, or a bare SAFE.
+# UNSAFE is tried first at each position, so a match on "SAFE" alone
+# means no UNSAFE-with-details verdict starts there.
+_VERDICT_RE = re.compile(r"UNSAFE\s*:?\s*(.+)|SAFE", re.IGNORECASE)
+
+# Python identifiers in the UNSAFE details
+_IDENTIFIER_RE = re.compile(r"\b[a-z_][a-z0-9_]*\b", re.IGNORECASE)
+
+# Common words that are not parameter names
+_PARAM_STOPWORDS = frozenset({
+    "the", "and", "or", "but", "for", "not", "all", "any", "can",
+    "will", "would", "should", "could", "might", "must", "may",
+    "calls", "check", "checks", "detected", " crash", "crashes",
+    "because", "since", "as", "if", "when", "then", "than", "that",
+    "this", "these", "those", "them", "they", "their", "there",
+    "here", "where", "which", "each", "every", "some", "such", "same",
+    "used", "use", "using", "without", "with", "from", "into", "to",
+    "in", "on", "at", "by", "of", "is", "it", "its", "are", "was",
+    "be", "been", "being", "have", "has", "had", "do", "does", "did",
+    "no", "yes", "none", "null", "nil", "safe", "unsafe", "unclear",
+    "parameters", "parameter", "params", "param", "function", "func",
+    "handled", "handlers", "handling", "list", "dict", "set", "str",
+    "int", "float", "bool", "true", "false", "return", "returns",
+})
+
+# Identifiers longer than every stopword skip the stopword lookup
+_MAX_STOPWORD_LEN = max(len(word) for word in _PARAM_STOPWORDS)
+
+# Maximum number of parameter names extracted from one response
+_MAX_PARAMS = 5
+
+
+def _scan_verdict(response: str) -> Tuple[str, Optional[str]]:
+    """
+    Classify a response in one pass over the verdict pattern.
+
+    Args:
+        response: Raw LLM response string
+
+    Returns:
+        A tuple of (answer_type, unsafe_details); unsafe_details is the
+        text following the UNSAFE verdict, or None for SAFE/UNCLEAR
+    """
+    answer_type = "UNCLEAR"
+    for match in _VERDICT_RE.finditer(response):
+        details = match.group(1)
+        if details is not None:
+            return "UNSAFE", details
+        answer_type = "SAFE"
+    return answer_type, None
 
 
 def parse_null_safety_response(response: str) -> Tuple[str, List[str]]:
@@ -32,26 +83,15 @@ def parse_null_safety_response(response: str) -> Tuple[str, List[str]]:
         >>> parse_null_safety_response("I'm not sure")
         ('UNCLEAR', [])
     """
-    response = response.strip()
-
-    # Check for UNSAFE first (must come before SAFE since UNSAFE contains SAFE)
-    unsafe_match = re.search(r"UNSAFE\s*:?\s*(.+)", response, re.IGNORECASE)
-    if unsafe_match:
-        # Extract parameter names from the response
-        # Parameters are typically at the start before parentheses
-        details = unsafe_match.group(1)
+    answer_type, details = _scan_verdict(response.strip())
 
+    if details is not None:
         # Extract parameter names (alphanumeric + underscore)
         # Look for patterns like "name, data" or "name and data" or just "name"
-        params = _extract_param_names(details)
-        return "UNSAFE", params
-
-    # Check for SAFE
-    if re.search(r"SAFE", response, re.IGNORECASE):
-        return "SAFE", []
+        return answer_type, _extract_param_names(details)
 
-    # Default to UNCLEAR for any other response
-    return "UNCLEAR", []
+    # SAFE, or UNCLEAR for any other response
+    return answer_type, []
 
 
 def _extract_param_names(text: str) -> List[str]:
@@ -67,54 +107,36 @@ def _extract_param_names(text: str) -> List[str]:
     Returns:
         List of parameter names found
     """
-    # Find all Python identifiers
-    identifiers = re.findall(r"\b[a-z_][a-z0-9_]*\b", text, re.IGNORECASE)
-
-    # Filter out common words that are not parameter names
-    exclude = {
-        "the", "and", "or", "but", "for", "not", "all", "any", "can",
-        "will", "would", "should", "could", "might", "must", "may",
-        "calls", "check", "checks", "detected", " crash", "crashes",
-        "because", "since", "as", "if", "when", "then", "than", "that",
-        "this", "these", "those", "them", "they", "their", "there",
-        "here", "where", "which", "each", "every", "some", "such", "same",
-        "used", "use", "using", "without", "with", "from", "into", "to",
-        "in", "on", "at", "by", "of", "is", "it", "its", "are", "was",
-        "be", "been", "being", "have", "has", "had", "do", "does", "did",
-        "no", "yes", "none", "null", "nil", "safe", "unsafe", "unclear",
-        "parameters", "parameter", "params", "param", "function", "func",
-        "handled", "handlers", "handling", "list", "dict", "set", "str",
-        "int", "float", "bool", "true", "false", "return", "returns",
-    }
-
-    params = [id for id in identifiers if id.lower() not in exclude and len(id) > 1]
-
-    # Return unique names, limited to reasonable count
+    # Filter, de-duplicate and cap in a single pass over the identifiers
     seen = set()
-    unique_params = []
-    for p in params:
-        if p not in seen:
-            seen.add(p)
-            unique_params.append(p)
-            if len(unique_params) >= 5:  # Limit to 5 params
-                break
+    unique_params: List[str] = []
+    for match in _IDENTIFIER_RE.finditer(text):
+        name = match.group()
+        if len(name) < 2 or name in seen:
+            continue
+        if len(name) <= _MAX_STOPWORD_LEN and name.lower() in _PARAM_STOPWORDS:
+            continue
+        seen.add(name)
+        unique_params.append(name)
+        if len(unique_params) >= _MAX_PARAMS:
+            break
 
     return unique_params
 
 
 def is_safe_response(response: str) -> bool:
     """Check if response indicates SAFE (no issues)."""
-    answer_type, _ = parse_null_safety_response(response)
+    answer_type, _ = _scan_verdict(response.strip())
     return answer_type == "SAFE"
 
 
 def is_unsafe_response(response: str) -> bool:
     """Check if response indicates UNSAFE (has issues)."""
-    answer_type, _ = parse_null_safety_response(response)
+    answer_type, _ = _scan_verdict(response.strip())
     return answer_type == "UNSAFE"
 
 
 def is_unclear_response(response: str) -> bool:
     """Check if response is UNCLEAR (could not determine)."""
-    answer_type, _ = parse_null_safety_response(response)
+    answer_type, _ = _scan_verdict(response.strip())
     return answer_type == "UNCLEAR"
@@ -268,6 +268,9 @@ class VerificationIssue(BaseModel):
     llm_metadata: Optional[LLMCheckMetadata] = Field(
         default=None, description="Metadata if LLM-assisted"
     )
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Structured measurements behind the finding"
+    )
 
 
 class VerificationReport(BaseModel):
@@ -10,17 +10,36 @@ This module provides:
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 import structlog
 
 from backend.analysis.unified_analyzer import AnalysisResult
 
 logger = structlog.get_logger()
 
+# Issue severity -> SARIF result level; unknown severities map to "note"
+_SARIF_LEVELS: Dict[str, str] = {
+    "critical": "error",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+}
+
+# Non-string dict keys (e.g. line numbers) are stringified, as json.dumps does
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib json encoder does not handle."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
 
 class ReportExporter:
     """Export analysis reports in various formats."""
@@ -28,30 +47,52 @@ class ReportExporter:
     def __init__(self, result: AnalysisResult) -> None:
         self.result = result
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: Optional[int] = 2) -> str:
         """
         Export report as JSON.
 
+        Non-ASCII characters are emitted as-is rather than \\u-escaped, and
+        compact output (indent=None) has no spaces after separators.
+
         Args:
-            indent: JSON indentation level
+            indent: JSON indentation level, or None for compact output
 
         Returns:
             JSON string
         """
+        if indent == 2:
+            return self.json
+        return self._encode_json(indent)
+
+    @cached_property
+    def json(self) -> str:
+        """Report as 2-space indented JSON, serialized once per exporter."""
+        return self._encode_json(2)
+
+    def _encode_json(self, indent: Optional[int]) -> str:
+        """Serialize the report dict with the given indentation."""
         report = self._build_report_dict()
 
-        # Convert datetime to string for JSON serialization
-        def json_serializer(obj: Any) -> Any:
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
+        # orjson natively handles datetimes but only supports 2-space indent
+        if indent is None:
+            return orjson.dumps(report, option=_ORJSON_OPTIONS).decode()
+        if indent == 2:
+            return orjson.dumps(report, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode()
+        return json.dumps(report, indent=indent, default=_json_default, ensure_ascii=False)
 
-        return json.dumps(report, indent=indent, default=json_serializer)
+    @cached_property
+    def sarif(self) -> str:
+        """SARIF report as 2-space indented JSON, serialized once per exporter."""
+        return orjson.dumps(
+            self.to_sarif(), option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2
+        ).decode()
 
     def to_sarif(self) -> Dict[str, Any]:
         """
         Export report in SARIF format (Static Analysis Results Interchange Format).
 
+        Each call builds a new dict, so callers may modify the result freely.
+
         Returns:
             SARIF dict
         """
@@ -176,17 +217,17 @@ class ReportExporter:
 
         return results
 
-    def _map_severity_to_level(self, severity: str) -> str:
+    @staticmethod
+    def _map_severity_to_level(severity: str) -> str:
         """Map severity to SARIF level."""
-        mapping = {
-            "critical": "error",
-            "high": "error",
-            "medium": "warning",
-            "low": "note",
-        }
-        return mapping.get(severity, "note")
+        return _SARIF_LEVELS.get(severity, "note")
 
     def to_console(self) -> str:
+        """Return the console report; see :attr:`console`."""
+        return self.console
+
+    @cached_property
+    def console(self) -> str:
         """
         Format report for console output.
 
@@ -247,6 +288,11 @@ class ReportExporter:
         return "\n".join(lines)
 
     def to_html(self) -> str:
+        """Return the HTML report; see :attr:`html`."""
+        return self.html
+
+    @cached_property
+    def html(self) -> str:
         """
         Generate HTML report.
 
@@ -377,8 +423,7 @@ def export_report(
     if format == "json":
         content = exporter.to_json()
     elif format == "sarif":
-        sarif_dict = exporter.to_sarif()
-        content = json.dumps(sarif_dict, indent=2)
+        content = exporter.sarif
     elif format == "console":
         content = exporter.to_console()
     elif format == "html":
@@ -387,7 +432,7 @@ def export_report(
         raise ValueError(f"Unknown format: {format}")
 
     if output_path:
-        Path(output_path).write_text(content)
+        Path(output_path).write_text(content, encoding="utf-8")
 
     return content
 
@@ -9,11 +9,13 @@ This module provides:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List
 
 import structlog
 
 from backend.analysis import CFGBuilder
+from backend.analysis.cfg import visualize_cfg_dot
+from backend.analysis.common import parse_cached
 from backend.analysis.unified_analyzer import AnalysisResult
 
 logger = structlog.get_logger()
@@ -152,13 +154,14 @@ def generate_dot_cfg(source_code: str, function_name: str) -> str:
     Returns:
         DOT format string
     """
-    try:
-        builder = CFGBuilder(source_code)
-        cfg = builder.build_function_cfg(function_name)
-        if cfg:
+    # Reuse the tree the analyzers already parsed for this source
+    tree = parse_cached(source_code)
+    if tree is not None:
+        try:
+            cfg = CFGBuilder(source_code).build(tree, function_name)
             return visualize_cfg_dot(cfg)
-    except Exception as e:
-        logger.warning("cfg_generation_failed", function=function_name, error=str(e))
+        except Exception as e:
+            logger.warning("cfg_generation_failed", function=function_name, error=str(e))
 
     # Fallback: generate simple DOT
     return f"""digraph cfg_{function_name} {{
@@ -169,56 +172,6 @@ def generate_dot_cfg(source_code: str, function_name: str) -> str:
 """
 
 
-def visualize_cfg_dot(cfg) -> str:
-    """
-    Visualize CFG as DOT format.
-
-    Args:
-        cfg: ControlFlowGraph from CFGBuilder
-
-    Returns:
-        DOT format string
-    """
-    dot = [f"digraph cfg {{", "  node [shape=rectangle, style=rounded];"]
-
-    # Add nodes and edges from CFG
-    added_nodes = set()
-
-    def add_node(node_id: str, label: str = "") -> None:
-        if node_id not in added_nodes:
-            added_nodes.add(node_id)
-            if label:
-                dot.append(f'  "{node_id}" [label="{label}"];')
-            else:
-                dot.append(f'  "{node_id}";')
-
-    def walk_cfg(node_id: str, visited: Optional[set] = None) -> None:
-        if visited is None:
-            visited = set()
-        if node_id in visited:
-            return
-        visited.add(node_id)
-
-        # Get node from CFG
-        # This is simplified - real implementation would traverse CFG structure
-        # For now, just add the node and a basic end node
-        add_node(node_id)
-
-        if cfg.exit_id:
-            add_node(cfg.exit_id)
-            dot.append(f'  "{node_id}" -> "{cfg.exit_id}";')
-
-    # Add basic structure
-    if hasattr(cfg, "entry_id") and cfg.entry_id:
-        add_node(cfg.entry_id, "entry")
-        if hasattr(cfg, "exit_id") and cfg.exit_id:
-            add_node(cfg.exit_id, "exit")
-            dot.append(f'  "{cfg.entry_id}" -> "{cfg.exit_id}";')
-
-    dot.append("}")
-    return "\n".join(dot)
-
-
 def generate_visualizations(result: AnalysisResult) -> Dict[str, Any]:
     """
     Generate all visualizations for an analysis result.
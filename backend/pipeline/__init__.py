@@ -1,6 +1,11 @@
 """Pipeline modules for Program Mill."""
 
-from .analyzer import analyze_python_file, analyze_python_file_sync, run_null_safety_check
+from .analyzer import (
+    analyze_ast,
+    analyze_python_file,
+    analyze_python_file_sync,
+    run_null_safety_check,
+)
 from .cross_validator import (
     cross_validate_exception_handling,
     cross_validate_has_return_on_all_paths,
@@ -14,6 +19,7 @@ from .report_generator import (
 )
 
 __all__ = [
+    "analyze_ast",
     "analyze_python_file",
     "analyze_python_file_sync",
     "run_null_safety_check",
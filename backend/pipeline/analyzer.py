@@ -1,5 +1,6 @@
 """Main pipeline orchestrator for Program Mill analysis."""
 
+import ast
 import asyncio
 from pathlib import Path
 from typing import List, Optional
@@ -7,6 +8,7 @@ from typing import List, Optional
 import structlog
 
 from backend.analysis.ast_parser import (
+    FunctionExtractor,
     FunctionInfo,
     get_function_ast_node,
     parse_python_file,
@@ -67,6 +69,49 @@ async def analyze_python_file(
         function_count=len(functions)
     )
 
+    return await _analyze_functions(tree, functions, source_code, file_path, llm_adapter)
+
+
+async def analyze_ast(
+    tree: ast.Module,
+    source_code: str,
+    file_path: str = "<memory>",
+    llm_adapter: Optional[LLMAdapter] = None
+) -> VerificationReport:
+    """
+    Run the verification pipeline on an already-parsed module.
+
+    Skips reading and re-parsing a file. The source is still required:
+    facts, line counts and the report hash are taken from its text, so
+    the tree must have been parsed from it.
+
+    Args:
+        tree: Module AST parsed from source_code
+        source_code: Python source code the tree was parsed from
+        file_path: Path recorded in the report
+        llm_adapter: Optional LLM adapter for Tier 3 checks
+
+    Returns:
+        Complete VerificationReport with all findings
+    """
+    logger.info("analysis_started", file_path=file_path)
+
+    extractor = FunctionExtractor(source_code.splitlines())
+    extractor.visit(tree)
+
+    return await _analyze_functions(
+        tree, extractor.functions, source_code, file_path, llm_adapter
+    )
+
+
+async def _analyze_functions(
+    tree: ast.Module,
+    functions: List[FunctionInfo],
+    source_code: str,
+    file_path: str,
+    llm_adapter: Optional[LLMAdapter],
+) -> VerificationReport:
+    """Run Tier 2/3 checks on each function and build the report."""
     all_issues: List[VerificationIssue] = []
 
     # Step 3: Analyze each function
@@ -222,7 +267,8 @@ async def run_null_safety_check(
 
 def analyze_python_file_sync(
     file_path: str,
-    llm_adapter: Optional[LLMAdapter] = None
+    llm_adapter: Optional[LLMAdapter] = None,
+    runner: Optional[asyncio.Runner] = None,
 ) -> VerificationReport:
     """
     Synchronous wrapper for analyze_python_file.
@@ -230,8 +276,13 @@ def analyze_python_file_sync(
     Args:
         file_path: Path to the Python file to analyze
         llm_adapter: Optional LLM adapter for Tier 3 checks
+        runner: Optional asyncio.Runner whose event loop is reused across
+            calls; by default each call creates and closes its own loop
 
     Returns:
         Complete VerificationReport with all findings
     """
-    return asyncio.run(analyze_python_file(file_path, llm_adapter))
+    coro = analyze_python_file(file_path, llm_adapter)
+    if runner is not None:
+        return runner.run(coro)
+    return asyncio.run(coro)
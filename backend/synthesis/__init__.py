@@ -12,6 +12,7 @@ from backend.synthesis.refactoring_suggester import (
     RefactoringSuggester,
     generate_refactoring_report,
     suggest_refactorings,
+    suggest_refactorings_ast,
 )
 from backend.synthesis.test_generator import (
     GeneratedTest,
@@ -31,6 +32,7 @@ __all__ = [
     "RefactoringSuggester",
     "generate_refactoring_report",
     "suggest_refactorings",
+    "suggest_refactorings_ast",
     "GeneratedTest",
     "TestGenerator",
     "generate_test_file",
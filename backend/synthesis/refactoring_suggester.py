@@ -15,6 +15,7 @@ from typing import List, Optional
 
 import structlog
 
+from backend.analysis.common import parse_cached
 from backend.models import FunctionInfo
 
 logger = structlog.get_logger()
@@ -182,11 +183,31 @@ def suggest_refactorings(
     Returns:
         List of RefactoringSuggestion objects
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
+    return suggest_refactorings_ast(tree, functions, source_code)
+
+
+def suggest_refactorings_ast(
+    tree: ast.AST,
+    functions: List[FunctionInfo],
+    source_code: str = "",
+) -> List[RefactoringSuggestion]:
+    """
+    Suggest refactorings for an already-parsed module.
+
+    Skips the parse done by suggest_refactorings; the tree is only read.
+
+    Args:
+        tree: Parsed module AST
+        functions: List of functions to analyze
+        source_code: Python source code of the module, if available
+
+    Returns:
+        List of RefactoringSuggestion objects
+    """
     suggester = RefactoringSuggester(source_code)
     suggester.visit(tree)
 
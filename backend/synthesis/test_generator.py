@@ -9,17 +9,19 @@ This module generates:
 from __future__ import annotations
 
 import ast
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Optional
 
 import structlog
 
+from backend.analysis.common import _is_trivial_source, parse_cached
 from backend.models import FunctionInfo
 
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedTest:
     """A generated test case."""
 
@@ -211,9 +213,11 @@ def generate_tests(
     Returns:
         List of GeneratedTest objects
     """
-    try:
-        tree = ast.parse(source_code)
-    except SyntaxError:
+    if _is_trivial_source(source_code):
+        return []
+
+    tree = parse_cached(source_code)
+    if tree is None:
         return []
 
     generator = TestGenerator(source_code)
@@ -257,13 +261,14 @@ def generate_test_report(tests: List[GeneratedTest]) -> dict:
     Returns:
         Dict with summary and details
     """
+    type_counts = Counter(t.test_type for t in tests)
+
     return {
         "summary": {
             "total_tests": len(tests),
             "by_type": {
-                "unit": len([t for t in tests if t.test_type == "unit"]),
-                "edge_case": len([t for t in tests if t.test_type == "edge_case"]),
-                "property": len([t for t in tests if t.test_type == "property"]),
+                test_type: type_counts[test_type]
+                for test_type in ("unit", "edge_case", "property")
             },
         },
         "tests": [
@@ -1,7 +1,96 @@
 """Pytest configuration and fixtures for Program Mill tests."""
 
+import ast
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple
+
 import pytest
 
+from backend.analysis.common import parse_cached
+from backend.analysis.unified_analyzer import AnalysisResult, analyze_code
+from backend.models import VerificationReport
+from backend.pipeline.analyzer import analyze_python_file_sync
+
+
+def _code_key(code: str) -> str:
+    """Return the content hash used to key per-snippet test artifacts."""
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def code_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], Path]:
+    """Return a helper that writes each distinct code string to one file.
+
+    Files live in a session temp directory that pytest cleans up, and a
+    snippet already on disk is returned without being rewritten.
+    """
+    directory = tmp_path_factory.mktemp("pmill")
+
+    def write(code: str) -> Path:
+        path = directory / f"{_code_key(code)}.py"
+        if not path.exists():
+            path.write_text(code, encoding="utf-8")
+        return path
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def async_runner() -> Iterator[asyncio.Runner]:
+    """One event loop reused by every synchronous pipeline call."""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def analyzed(
+    code_file: Callable[[str], Path],
+    async_runner: asyncio.Runner,
+) -> Callable[[str], VerificationReport]:
+    """Return a helper that runs the pipeline once per distinct code string.
+
+    Reports are memoized by the SHA-256 of the code, so tests analyzing
+    the same snippet share one report and must treat it as read-only.
+    """
+    reports: Dict[str, VerificationReport] = {}
+
+    def analyze(code: str) -> VerificationReport:
+        key = _code_key(code)
+        report = reports.get(key)
+        if report is None:
+            report = analyze_python_file_sync(str(code_file(code)), runner=async_runner)
+            reports[key] = report
+        return report
+
+    return analyze
+
+
+@pytest.fixture(scope="session")
+def unified_analyzed() -> Callable[..., AnalysisResult]:
+    """Return a helper that runs analyze_code once per distinct input.
+
+    Results are memoized on (code, file_path, skip_patterns), so tests
+    analyzing the same snippet share one AnalysisResult and must treat it
+    as read-only. Tests that need a fresh analysis_id call analyze_code.
+    """
+    results: Dict[Tuple[str, str, bool], AnalysisResult] = {}
+
+    def analyze(
+        code: str,
+        file_path: str = "unknown.py",
+        skip_patterns: bool = False,
+    ) -> AnalysisResult:
+        key = (code, file_path, skip_patterns)
+        result = results.get(key)
+        if result is None:
+            result = analyze_code(code, file_path=file_path, skip_patterns=skip_patterns)
+            results[key] = result
+        return result
+
+    return analyze
+
 
 @pytest.fixture
 def sample_python_code() -> str:
@@ -25,7 +114,7 @@ class Calculator:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def vulnerable_code() -> str:
     """Sample code with security vulnerabilities."""
     return """
@@ -42,7 +131,7 @@ def execute_command(user_input: str):
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_code() -> str:
     """Sample code with high complexity."""
     return """
@@ -67,3 +156,23 @@ def complex_function(x, y, z):
             return -x - y
     return 0
 """
+
+
+@pytest.fixture(scope="session")
+def multi_issue_code() -> str:
+    """Sample function mixing SQL formatting, a database sink and file input."""
+    return """
+def process(user_input, filename):
+    # This function has multiple potential issues
+    sql = "SELECT * FROM data WHERE name = '%s'" % user_input
+    cursor.execute(sql)
+
+    with open(filename) as f:
+        return f.read()
+"""
+
+
+@pytest.fixture(scope="session")
+def multi_issue_tree(multi_issue_code: str) -> ast.Module:
+    """Shared parse of multi_issue_code; visitors must not mutate it."""
+    return parse_cached(multi_issue_code)
@@ -0,0 +1,144 @@
+"""Tests for shared analysis helpers."""
+
+import ast
+
+import pytest
+
+from backend.analysis.ast_parser import build_code_structure
+from backend.analysis.maintainability_critic import MaintainabilityIssue
+from backend.analysis.security_boundaries import (
+    classify_trust_levels,
+    identify_input_boundaries,
+    identify_output_boundaries,
+    identify_privilege_boundaries,
+)
+from backend.analysis.security_critic import analyze_security_issues
+from backend.synthesis.test_generator import generate_tests
+from backend.analysis.common import (
+    _fingerprint,
+    _index_by_type,
+    _is_trivial_source,
+    parse_cached,
+)
+
+
+class TestParseCached:
+    """Test memoized parsing."""
+
+    def test_returns_module(self):
+        """Test that valid source parses to a module."""
+        tree = parse_cached("def f(): return 1")
+
+        assert isinstance(tree, ast.Module)
+
+    def test_same_source_shares_tree(self):
+        """Test that identical source returns the cached tree."""
+        assert parse_cached("x = 1\n") is parse_cached("x = 1\n")
+
+    def test_syntax_error_returns_none(self):
+        """Test that invalid source returns None instead of raising."""
+        assert parse_cached("def broken(") is None
+
+    def test_syntax_error_is_cached(self, monkeypatch):
+        """Test that a known-bad source is not parsed again."""
+        source = "def cached_failure("
+        assert parse_cached(source) is None
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("ast.parse called for a cached failure")
+
+        monkeypatch.setattr(ast, "parse", fail_parse)
+
+        assert parse_cached(source) is None
+
+
+class TestParseCachedConsumers:
+    """Test analyzers that parse through the shared cache."""
+
+    @pytest.mark.parametrize("analyze,empty", [
+        pytest.param(lambda code: identify_input_boundaries(code, []), [], id="input_boundaries"),
+        pytest.param(lambda code: identify_output_boundaries(code, []), [], id="output_boundaries"),
+        pytest.param(
+            lambda code: identify_privilege_boundaries(code, []), [], id="privilege_boundaries"
+        ),
+        pytest.param(classify_trust_levels, {}, id="trust_levels"),
+        pytest.param(lambda code: analyze_security_issues(code, []), [], id="security_critic"),
+        pytest.param(lambda code: generate_tests(code, []), [], id="test_generator"),
+    ])
+    def test_syntax_error_yields_empty_result(self, analyze, empty):
+        """Test that unparsable source gives an empty result instead of raising."""
+        assert analyze("def broken(") == empty
+
+    def test_code_structure_reuses_cached_tree(self, monkeypatch):
+        """Test that build_code_structure parses through the shared cache."""
+        source = "def shared_structure(): return 1"
+        parse_cached(source)
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("ast.parse called for a cached source")
+
+        monkeypatch.setattr(ast, "parse", fail_parse)
+
+        assert build_code_structure(source).functions[0].name == "shared_structure"
+
+    def test_code_structure_still_raises_syntax_error(self):
+        """Test that build_code_structure keeps raising on invalid source."""
+        with pytest.raises(SyntaxError):
+            build_code_structure("def broken(")
+
+
+class TestTrivialSource:
+    """Test the trivial-source gate."""
+
+    def test_blank_source_is_trivial(self):
+        """Test that empty and whitespace-only sources are trivial."""
+        assert _is_trivial_source("")
+        assert _is_trivial_source("  \n\t ")
+
+    def test_short_source_without_def_is_trivial(self):
+        """Test that short sources without def are trivial."""
+        assert _is_trivial_source("x = 1")
+
+    def test_short_function_is_not_trivial(self):
+        """Test that short function definitions are still analyzed."""
+        assert not _is_trivial_source("def f(): pass")
+        assert not _is_trivial_source("def\tf(): pass")
+
+    def test_long_source_is_not_trivial(self):
+        """Test that sources at or above the threshold are parsed."""
+        assert not _is_trivial_source("total = price * quantity")
+
+
+class TestFingerprint:
+    """Test content fingerprints."""
+
+    def test_equal_texts_share_fingerprint(self):
+        """Test that equal texts fingerprint identically."""
+        assert _fingerprint("return x + 1") == _fingerprint("return x + 1")
+
+    def test_fingerprint_fits_64_bits(self):
+        """Test that fingerprints are 64-bit integers."""
+        assert 0 <= _fingerprint("return x + 1") < 2 ** 64
+
+    def test_different_texts_differ(self):
+        """Test that different texts fingerprint differently."""
+        assert _fingerprint("return x + 1") != _fingerprint("return x + 2")
+
+
+class TestIndexByType:
+    """Test the issue-type position index."""
+
+    def test_index_by_type(self):
+        """Test that types map to issue positions in first-occurrence order."""
+        index = _index_by_type([
+            MaintainabilityIssue("long_function", "f1", 1, "medium", "desc1"),
+            MaintainabilityIssue("deep_nesting", "f2", 2, "low", "desc2"),
+            MaintainabilityIssue("long_function", "f3", 3, "low", "desc3"),
+        ])
+
+        assert index == {"long_function": [0, 2], "deep_nesting": [1]}
+        assert list(index) == ["long_function", "deep_nesting"]
+
+    def test_empty_issues(self):
+        """Test that no issues give an empty index."""
+        assert _index_by_type([]) == {}
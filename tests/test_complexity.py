@@ -6,6 +6,7 @@ from backend.analysis.complexity import (
     compute_all_metrics,
     compute_cognitive_complexity,
     compute_cyclomatic_complexity,
+    compute_function_complexities,
     compute_maintainability_index,
     enrich_all_functions,
     enrich_function_with_complexity,
@@ -112,6 +113,55 @@ def complex_func(x, y):
         assert cc > 5
 
 
+class TestFunctionComplexities:
+    """Test per-function cyclomatic complexity in one pass."""
+
+    def test_functions_and_methods(self):
+        """Test that functions and methods are keyed by name and line, classes skipped."""
+        code = """
+class Handler:
+    def handle(self, x):
+        if x:
+            return 1
+        return 0
+
+def plain():
+    return 1
+"""
+        assert compute_function_complexities(code) == {("handle", 3): 2, ("plain", 8): 1}
+
+    def test_same_named_methods_stay_distinct(self):
+        """Test that methods sharing a name keep their own complexity."""
+        code = """
+class A:
+    def run(self):
+        return 1
+
+class B:
+    def run(self, x):
+        if x:
+            return 1
+        return 0
+"""
+        assert compute_function_complexities(code) == {("run", 3): 1, ("run", 7): 2}
+
+    def test_nested_functions_included(self):
+        """Test that closures are reported at their own def line."""
+        code = """
+def outer(x):
+    def inner(y):
+        if y:
+            return 1
+        return 0
+    return inner(x)
+"""
+        assert compute_function_complexities(code) == {("outer", 2): 1, ("inner", 3): 2}
+
+    def test_syntax_error_returns_empty(self):
+        """Test that unparsable source yields no complexities."""
+        assert compute_function_complexities("def broken(") == {}
+
+
 class TestCognitiveComplexity:
     """Test cognitive complexity calculation."""
 
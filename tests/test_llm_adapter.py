@@ -4,7 +4,13 @@ import asyncio
 
 import pytest
 
-from backend.llm import LLMAdapter, LLMError, StubLLMAdapter, FailingLLMAdapter
+from backend.llm import (
+    LLMAdapter,
+    LLMError,
+    StubLLMAdapter,
+    FailingLLMAdapter,
+    is_async_adapter,
+)
 
 
 class TestStubLLMAdapter:
@@ -58,10 +64,8 @@ class TestStubLLMAdapter:
         await stub.complete("prompt2", temperature=0.5)
 
         assert len(stub.call_history) == 2
-        assert stub.call_history[0]["prompt"] == "prompt1"
-        assert stub.call_history[0]["kwargs"]["max_tokens"] == 100
-        assert stub.call_history[1]["prompt"] == "prompt2"
-        assert stub.call_history[1]["kwargs"]["temperature"] == 0.5
+        assert stub.call_history[0] == ("prompt1", {"max_tokens": 100})
+        assert stub.call_history[1] == ("prompt2", {"temperature": 0.5})
 
     @pytest.mark.asyncio
     async def test_get_last_call(self):
@@ -210,8 +214,8 @@ class TestLLMAdapterInterface:
         assert callable(stub.complete)
 
         # Verify it's async
-        import inspect
-        assert inspect.iscoroutinefunction(stub.complete)
+        assert is_async_adapter(type(stub))
+        assert is_async_adapter(FailingLLMAdapter)
 
 
 class TestNullSafetyStubResponses:
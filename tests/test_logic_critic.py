@@ -1,5 +1,7 @@
 """Tests for logic critic."""
 
+import sys
+
 import pytest
 
 from backend.analysis.logic_critic import (
@@ -11,6 +13,7 @@ from backend.analysis.logic_critic import (
     LogicIssue,
     PreconditionCheck,
 )
+from backend.analysis.common import parse_cached
 from backend.models import FunctionInfo
 
 
@@ -21,7 +24,7 @@ class TestLogicIssueDetection:
         """Test with empty code."""
         issues = analyze_logic_issues("", [])
 
-        assert issues == []
+        assert issues == ()
 
     def test_missing_precondition_check(self):
         """Test detection of missing precondition checks."""
@@ -32,7 +35,7 @@ def process(value: Optional[str]) -> str:
         functions = [FunctionInfo(name="process", line_start=2, line_end=3, parameters=["value"])]
         issues = analyze_logic_issues(code, functions)
 
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
 
     def test_division_by_zero_detection(self):
         """Test division by zero detection."""
@@ -165,6 +168,20 @@ class TestLogicReport:
         assert report["summary"]["by_severity"]["low"] == 1
         assert report["summary"]["by_severity"]["high"] == 2
 
+    def test_report_indexes_issues_by_type(self):
+        """Test that the report indexes issue positions by type."""
+        issues = [
+            LogicIssue("division_by_zero_risk", "f1", 1, "medium", "desc1"),
+            LogicIssue("unreachable_code", "f2", 2, "low", "desc2"),
+            LogicIssue("division_by_zero_risk", "f3", 3, "medium", "desc3"),
+        ]
+
+        report = generate_logic_report(issues, [])
+
+        index = report["by_type_index"]
+        assert "unreachable_code" in index
+        assert [report["issues"][i]["function"] for i in index["division_by_zero_risk"]] == ["f1", "f3"]
+
 
 class TestLogicCriticClass:
     """Test LogicCritic class."""
@@ -179,9 +196,8 @@ class TestLogicCriticClass:
     def test_visits_function(self):
         """Test that critic visits functions."""
         code = "def test(): return 1"
-        import ast
 
-        tree = ast.parse(code)
+        tree = parse_cached(code)
         critic = LogicCritic(code)
         critic.visit(tree)
 
@@ -214,7 +230,7 @@ class TestEdgeCases:
         """Test with syntax error."""
         issues = analyze_logic_issues("def broken(", [])
 
-        assert issues == []
+        assert issues == ()
 
     def test_complex_function(self):
         """Test analysis of complex function."""
@@ -228,4 +244,18 @@ def complex_func(x, y):
 """
         issues = analyze_logic_issues(code, [])
 
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
+
+
+class TestLogicIssueInterning:
+    """Test interning of categorical issue fields."""
+
+    def test_categorical_fields_are_interned(self):
+        """Test that dynamically built labels share one string object."""
+        severity = "".join(["med", "ium"])
+        issue_type = "".join(["division_by_zero", "_risk"])
+
+        issue = LogicIssue(issue_type, "f", 1, severity, "desc")
+
+        assert issue.severity is sys.intern("medium")
+        assert issue.issue_type is sys.intern("division_by_zero_risk")
@@ -1,5 +1,7 @@
 """Tests for maintainability critic."""
 
+import dataclasses
+
 import pytest
 
 from backend.analysis.maintainability_critic import (
@@ -9,8 +11,30 @@ from backend.analysis.maintainability_critic import (
     analyze_maintainability_issues,
     generate_maintainability_report,
 )
+from backend.analysis.common import parse_cached
 from backend.models import FunctionInfo
 
+# 34-line function (docstring, 31 assignments, return), built once at import
+_LONG_FUNC_CODE = (
+    "\ndef long_function():\n    '''Docstring.'''\n"
+    + "\n".join(f"    x = {i}" for i in range(1, 32))
+    + "\n    return x\n"
+)
+
+# beta only renames alpha's locals; SequenceMatcher rates the pair ~0.94
+_RENAMED_CLONE_ALPHA = """def alpha(items):
+    value = items[0]
+    count = len(items)
+    result = value + count
+    return result
+"""
+_RENAMED_CLONE_BETA = """def beta(items):
+    value1 = items[0]
+    count1 = len(items)
+    result1 = value1 + count1
+    return result1
+"""
+
 
 class TestMaintainabilityIssueDetection:
     """Test maintainability issue detection."""
@@ -19,47 +43,11 @@ class TestMaintainabilityIssueDetection:
         """Test with empty code."""
         issues = analyze_maintainability_issues("", [])
 
-        assert issues == []
+        assert issues == ()
 
     def test_long_function_detection(self):
         """Test long function detection."""
-        code = """
-def long_function():
-    '''Docstring.'''
-    x = 1
-    x = 2
-    x = 3
-    x = 4
-    x = 5
-    x = 6
-    x = 7
-    x = 8
-    x = 9
-    x = 10
-    x = 11
-    x = 12
-    x = 13
-    x = 14
-    x = 15
-    x = 16
-    x = 17
-    x = 18
-    x = 19
-    x = 20
-    x = 21
-    x = 22
-    x = 23
-    x = 24
-    x = 25
-    x = 26
-    x = 27
-    x = 28
-    x = 29
-    x = 30
-    x = 31
-    return x
-"""
-        issues = analyze_maintainability_issues(code, [])
+        issues = analyze_maintainability_issues(_LONG_FUNC_CODE, [])
 
         assert any(i.issue_type == "long_function" for i in issues)
 
@@ -108,7 +96,7 @@ def calculate():
         issues = analyze_maintainability_issues(code, [])
 
         # May detect magic numbers
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
 
     def test_code_duplication(self):
         """Test code duplication detection."""
@@ -140,7 +128,7 @@ def BadName(x):
 """
         issues = analyze_maintainability_issues(code, [])
 
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
 
 
 class TestMaintainabilityReport:
@@ -152,6 +140,8 @@ class TestMaintainabilityReport:
 
         assert report["summary"]["total_issues"] == 0
         assert report["issues"] == []
+        assert type(report["summary"]["by_type"]) is dict
+        assert type(report["summary"]["by_severity"]) is dict
 
     def test_report_with_issues(self):
         """Test report with maintainability issues."""
@@ -214,9 +204,8 @@ class TestMaintainabilityCriticClass:
     def test_visits_function(self):
         """Test that critic visits functions."""
         code = "def test(): return 1"
-        import ast
 
-        tree = ast.parse(code)
+        tree = parse_cached(code)
         critic = MaintainabilityCritic(code)
         critic.visit(tree)
 
@@ -253,7 +242,7 @@ class TestEdgeCases:
         """Test with syntax error."""
         issues = analyze_maintainability_issues("def broken(", [])
 
-        assert issues == []
+        assert issues == ()
 
     def test_short_function_no_issues(self):
         """Test that short, clean functions don't trigger false positives."""
@@ -263,7 +252,7 @@ class TestEdgeCases:
 """
         issues = analyze_maintainability_issues(code, [])
 
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
 
     def test_class_methods(self):
         """Test method analysis in classes."""
@@ -277,7 +266,7 @@ class MyClass:
 """
         issues = analyze_maintainability_issues(code, [])
 
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
 
 
 class TestCodeDuplication:
@@ -301,6 +290,19 @@ class TestCodeDuplication:
 
         # Should detect duplication
         assert len(issues) > 0
+        assert "Similarity: 100%" in issues[0].description
+
+    def test_renamed_identifier_clone(self):
+        """Test that a clone differing only in local names is reported."""
+        bodies = [
+            ("alpha", _RENAMED_CLONE_ALPHA, 1, 5),
+            ("beta", _RENAMED_CLONE_BETA, 7, 11),
+        ]
+
+        issues = _detect_code_duplication(bodies)
+
+        assert [issue.function_name for issue in issues] == ["alpha"]
+        assert "Similarity: 94%" in issues[0].description
 
     def test_different_functions(self):
         """Test that different functions don't trigger."""
@@ -390,7 +392,7 @@ class Outer:
 """
         issues = analyze_maintainability_issues(code, [])
 
-        assert isinstance(issues, list)
+        assert isinstance(issues, (list, tuple))
 
 
 class TestDunderMethods:
@@ -413,3 +415,20 @@ class MyClass:
         for issue in missing_doc_issues:
             assert not issue.function_name.endswith("__init__")
             assert not issue.function_name.endswith("__str__")
+
+
+class TestIssueImmutability:
+    """Test that issues are slotted and immutable."""
+
+    def test_issue_is_frozen(self):
+        """Test that issue fields cannot be reassigned."""
+        issue = MaintainabilityIssue("long_function", "f1", 1, "medium", "desc1")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            issue.severity = "high"
+
+    def test_issue_has_no_instance_dict(self):
+        """Test that slots replace the per-instance __dict__."""
+        issue = MaintainabilityIssue("long_function", "f1", 1, "medium", "desc1")
+
+        assert not hasattr(issue, "__dict__")
@@ -2,6 +2,7 @@
 
 import pytest
 
+from backend.llm import StubLLMAdapter
 from backend.llm.prompts import build_null_safety_prompt
 from backend.llm.response_parser import (
     is_safe_response,
@@ -98,6 +99,35 @@ class TestPromptBuilder:
         # Should mention truncation
         assert "more" in prompt.lower()
 
+    def test_build_prompt_reuses_cached_prompt(self):
+        """Test that equal facts reuse the memoized prompt."""
+        def make_facts():
+            return FunctionFacts(
+                function_name="greet",
+                line_start=1,
+                line_end=2,
+                parameters=[ParameterInfo(name="name")],
+                calls=["str.upper"],
+                source_code='def greet(name): return name.upper()',
+            )
+
+        assert build_null_safety_prompt(make_facts()) is build_null_safety_prompt(make_facts())
+
+    def test_build_prompt_sees_mutated_facts(self):
+        """Test that mutating facts after a build is not served stale."""
+        facts = FunctionFacts(
+            function_name="greet",
+            line_start=1,
+            line_end=2,
+            parameters=[ParameterInfo(name="name")],
+            source_code='def greet(name): return name.upper()',
+        )
+        build_null_safety_prompt(facts)
+
+        facts.has_none_checks.append("name")
+
+        assert "Has None checks for: name" in build_null_safety_prompt(facts)
+
 
 class TestResponseParser:
     """Test the null safety response parser."""
@@ -193,18 +223,25 @@ class TestHelperFunctions:
         assert not is_unclear_response("UNSAFE: param")
 
 
+@pytest.fixture(scope="module")
+def null_safety_stub() -> StubLLMAdapter:
+    """One stub shared by the end-to-end tests, keyed on the analyzed source.
+
+    Keys must not occur in the prompt's few-shot examples (which mention
+    safe_greet), and are checked in insertion order.
+    """
+    return StubLLMAdapter({
+        "unsafe_greet": "UNSAFE: name (calls .upper() without None check)",
+        "return name.upper()": "SAFE: all parameters handled",
+    })
+
+
 class TestEndToEndNullSafetyCheck:
     """End-to-end tests for null safety check with stub adapter."""
 
-    @pytest.mark.asyncio
-    async def test_safe_function_with_stub(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_safe_function_with_stub(self, null_safety_stub):
         """Test checking a safe function with stub adapter."""
-        from backend.llm import StubLLMAdapter
-
-        stub = StubLLMAdapter({
-            "null safety": "SAFE: all parameters handled"
-        })
-
         facts = FunctionFacts(
             function_name="safe_greet",
             qualified_name="safe_greet",
@@ -218,22 +255,15 @@ class TestEndToEndNullSafetyCheck:
             source_code='def safe_greet(name):\n    if name is None: return "Hello"\n    return name.upper()',
         )
 
-        prompt = build_null_safety_prompt(facts)
-        response = await stub.complete(prompt)
+        response = await null_safety_stub.complete(build_null_safety_prompt(facts))
 
         answer_type, params = parse_null_safety_response(response)
         assert answer_type == "SAFE"
         assert params == []
 
-    @pytest.mark.asyncio
-    async def test_unsafe_function_with_stub(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_unsafe_function_with_stub(self, null_safety_stub):
         """Test checking an unsafe function with stub adapter."""
-        from backend.llm import StubLLMAdapter
-
-        stub = StubLLMAdapter({
-            "null safety": "UNSAFE: name (calls .upper() without None check)"
-        })
-
         facts = FunctionFacts(
             function_name="unsafe_greet",
             qualified_name="unsafe_greet",
@@ -247,21 +277,16 @@ class TestEndToEndNullSafetyCheck:
             source_code='def unsafe_greet(name): return name.upper()',
         )
 
-        prompt = build_null_safety_prompt(facts)
-        response = await stub.complete(prompt)
+        response = await null_safety_stub.complete(build_null_safety_prompt(facts))
 
         answer_type, params = parse_null_safety_response(response)
         assert answer_type == "UNSAFE"
         assert "name" in params
 
-    @pytest.mark.asyncio
-    async def test_unclear_response_with_stub(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_unclear_response_with_stub(self, null_safety_stub):
         """Test unclear response from stub adapter."""
-        from backend.llm import StubLLMAdapter
-
-        # Use default UNCLEAR response
-        stub = StubLLMAdapter({})
-
+        # No key matches, so the stub falls back to its UNCLEAR default
         facts = FunctionFacts(
             function_name="complex_func",
             qualified_name="complex_func",
@@ -275,8 +300,7 @@ class TestEndToEndNullSafetyCheck:
             source_code="def complex_func(data): ...",
         )
 
-        prompt = build_null_safety_prompt(facts)
-        response = await stub.complete(prompt)
+        response = await null_safety_stub.complete(build_null_safety_prompt(facts))
 
         answer_type, params = parse_null_safety_response(response)
         assert answer_type == "UNCLEAR"
@@ -1,9 +1,14 @@
 """Tests for pattern and anti-pattern detection."""
 
+import ast
+from collections import Counter
+from difflib import SequenceMatcher
+
 import pytest
 
 from backend.analysis.patterns import (
     detect_design_patterns,
+    detect_design_patterns_from_ast,
     detect_anti_patterns,
     generate_pattern_report,
     SingletonPatternDetector,
@@ -20,34 +25,23 @@ from backend.analysis.patterns import (
     DEFAULT_LONG_METHOD_LINES,
     DEFAULT_LARGE_CLASS_LINES,
     DEFAULT_MAGIC_NUMBER_THRESHOLD,
+    _ratio_upper_bound,
 )
 from backend.models import ClassInfo, FunctionInfo
 
 
-class TestSingletonPattern:
-    """Test Singleton pattern detection."""
-
-    def test_singleton_via_new(self):
-        """Test Singleton via __new__ override."""
-        code = """
-class Singleton:
+# Each family's snippets share one source so the detectors run once per family
+_SINGLETON_SRC = """
+class SingletonViaNew:
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
-"""
-        patterns = detect_design_patterns(code, [])
 
-        singleton_patterns = [p for p in patterns if p.pattern_type == "singleton"]
-        assert len(singleton_patterns) > 0
-        assert singleton_patterns[0].entity_name == "Singleton"
 
-    def test_singleton_via_get_instance(self):
-        """Test Singleton via getInstance method."""
-        code = """
-class Singleton:
+class SingletonViaGetInstance:
     _instance = None
 
     @classmethod
@@ -55,151 +49,246 @@ class Singleton:
         if cls._instance is None:
             cls._instance = cls()
         return cls._instance
-"""
-        patterns = detect_design_patterns(code, [])
 
-        singleton_patterns = [p for p in patterns if p.pattern_type == "singleton"]
-        assert len(singleton_patterns) > 0
 
-    def test_no_singleton(self):
-        """Test that normal classes aren't detected as Singleton."""
-        code = """
 class Normal:
     def __init__(self):
         self.value = 42
 """
-        patterns = detect_design_patterns(code, [])
-
-        singleton_patterns = [p for p in patterns if p.pattern_type == "singleton"]
-        assert len(singleton_patterns) == 0
 
-
-class TestFactoryPattern:
-    """Test Factory pattern detection."""
-
-    def test_factory_class(self):
-        """Test Factory class detection."""
-        code = """
+_FACTORY_SRC = """
 class Factory:
     def create_product(self, type):
         if type == "A":
             return ProductA()
         elif type == "B":
             return ProductB()
-"""
-        patterns = detect_design_patterns(code, [])
 
-        factory_patterns = [p for p in patterns if p.pattern_type == "factory"]
-        assert len(factory_patterns) > 0
 
-    def test_creator_class(self):
-        """Test Creator class detection."""
-        code = """
 class Creator:
     def make_object(self):
         return Object()
-"""
-        patterns = detect_design_patterns(code, [])
 
-        factory_patterns = [p for p in patterns if p.pattern_type == "factory"]
-        assert len(factory_patterns) > 0
 
-    def test_no_factory(self):
-        """Test that normal classes aren't detected as Factory."""
-        code = """
 class Normal:
     def process(self):
         pass
 """
-        patterns = detect_design_patterns(code, [])
 
-        factory_patterns = [p for p in patterns if p.pattern_type == "factory"]
-        assert len(factory_patterns) == 0
-
-
-class TestStrategyPattern:
-    """Test Strategy pattern detection."""
-
-    def test_strategy_class(self):
-        """Test Strategy class detection."""
-        code = """
+_STRATEGY_SRC = """
 class SortStrategy:
     def execute(self, data):
         raise NotImplementedError
-"""
-        patterns = detect_design_patterns(code, [])
 
-        strategy_patterns = [p for p in patterns if p.pattern_type == "strategy"]
-        assert len(strategy_patterns) > 0
 
-    def test_abstract_strategy(self):
-        """Test abstract Strategy with abstract methods."""
-        code = """
 class PaymentStrategy:
     def pay(self, amount):
         raise NotImplementedError
 
     def refund(self, amount):
         raise NotImplementedError
-"""
-        patterns = detect_design_patterns(code, [])
 
-        strategy_patterns = [p for p in patterns if p.pattern_type == "strategy"]
-        assert len(strategy_patterns) > 0
 
-    def test_no_strategy(self):
-        """Test that normal classes aren't detected as Strategy."""
-        code = """
 class Concrete:
     def do_work(self):
         return "working"
 """
-        patterns = detect_design_patterns(code, [])
-
-        strategy_patterns = [p for p in patterns if p.pattern_type == "strategy"]
-        assert len(strategy_patterns) == 0
-
 
-class TestDecoratorPattern:
-    """Test Decorator pattern detection."""
-
-    def test_decorator_function(self):
-        """Test decorator function detection."""
-        code = """
+_DECORATOR_SRC = """
 def my_decorator(func):
     def wrapper(*args, **kwargs):
         return func(*args, **kwargs)
     return wrapper
-"""
-        patterns = detect_design_patterns(code, [])
 
-        decorator_patterns = [p for p in patterns if p.pattern_type == "decorator"]
-        assert len(decorator_patterns) > 0
 
-    def test_named_decorator(self):
-        """Test decorator with 'decorator' in name."""
-        code = """
 def timer_decorator(func):
     def wrapper():
         result = func()
         return result
     return wrapper
-"""
-        patterns = detect_design_patterns(code, [])
 
-        decorator_patterns = [p for p in patterns if p.pattern_type == "decorator"]
-        assert len(decorator_patterns) > 0
 
-    def test_no_decorator(self):
-        """Test that normal functions aren't detected as Decorator."""
-        code = """
 def normal_function(x):
     return x * 2
 """
-        patterns = detect_design_patterns(code, [])
 
-        decorator_patterns = [p for p in patterns if p.pattern_type == "decorator"]
-        assert len(decorator_patterns) == 0
+
+# Parsed once at import; the detectors only read the trees
+_TREES = {
+    name: ast.parse(src)
+    for name, src in [
+        ("singleton", _SINGLETON_SRC),
+        ("factory", _FACTORY_SRC),
+        ("strategy", _STRATEGY_SRC),
+        ("decorator", _DECORATOR_SRC),
+    ]
+}
+
+
+def _entities(pattern_type):
+    """Return the names of entities detected as the given pattern type."""
+    return {
+        p.entity_name
+        for p in detect_design_patterns_from_ast(_TREES[pattern_type], [])
+        if p.pattern_type == pattern_type
+    }
+
+
+class TestDetectFromAst:
+    """Test the pre-parsed design pattern entrypoint."""
+
+    @pytest.mark.parametrize("source_code", [
+        pytest.param(_SINGLETON_SRC, id="singleton"),
+        pytest.param(_DECORATOR_SRC, id="decorator"),
+    ])
+    def test_matches_source_entrypoint(self, source_code):
+        """Test that a parsed tree yields the same matches as its source."""
+        from_source = detect_design_patterns(source_code, [])
+        from_tree = detect_design_patterns_from_ast(
+            ast.parse(source_code), [], source_code.splitlines()
+        )
+
+        assert from_tree == from_source
+
+
+@pytest.fixture(scope="module")
+def singletons():
+    """Singleton entities detected in the singleton snippets, computed once."""
+    return _entities("singleton")
+
+
+class TestSingletonPattern:
+    """Test Singleton pattern detection."""
+
+    @pytest.mark.parametrize("entity,expected", [
+        pytest.param("SingletonViaNew", True, id="via_new"),
+        pytest.param("SingletonViaGetInstance", True, id="via_get_instance"),
+        pytest.param("Normal", False, id="normal_class"),
+    ])
+    def test_detection(self, singletons, entity, expected):
+        """Test Singleton via __new__ or getInstance, and not normal classes."""
+        assert (entity in singletons) is expected
+
+
+@pytest.fixture(scope="module")
+def factories():
+    """Factory entities detected in the factory snippets, computed once."""
+    return _entities("factory")
+
+
+class TestFactoryPattern:
+    """Test Factory pattern detection."""
+
+    @pytest.mark.parametrize("entity,expected", [
+        pytest.param("Factory", True, id="factory_class"),
+        pytest.param("Creator", True, id="creator_class"),
+        pytest.param("Normal", False, id="normal_class"),
+    ])
+    def test_detection(self, factories, entity, expected):
+        """Test Factory and Creator classes, and not normal classes."""
+        assert (entity in factories) is expected
+
+
+@pytest.fixture(scope="module")
+def strategies():
+    """Strategy entities detected in the strategy snippets, computed once."""
+    return _entities("strategy")
+
+
+class TestStrategyPattern:
+    """Test Strategy pattern detection."""
+
+    @pytest.mark.parametrize("entity,expected", [
+        pytest.param("SortStrategy", True, id="strategy_class"),
+        pytest.param("PaymentStrategy", True, id="abstract_strategy"),
+        pytest.param("Concrete", False, id="concrete_class"),
+    ])
+    def test_detection(self, strategies, entity, expected):
+        """Test Strategy classes with abstract methods, and not concrete classes."""
+        assert (entity in strategies) is expected
+
+
+@pytest.fixture(scope="module")
+def decorators():
+    """Decorator entities detected in the decorator snippets, computed once."""
+    return _entities("decorator")
+
+
+class TestDecoratorPattern:
+    """Test Decorator pattern detection."""
+
+    @pytest.mark.parametrize("entity,expected", [
+        pytest.param("my_decorator", True, id="decorator_function"),
+        pytest.param("timer_decorator", True, id="named_decorator"),
+        pytest.param("normal_function", False, id="normal_function"),
+    ])
+    def test_detection(self, decorators, entity, expected):
+        """Test decorator functions, and not normal functions."""
+        assert (entity in decorators) is expected
+
+
+# Oversized snippets for the anti-pattern tests, built once at import
+_GOD_METHODS_SRC = "\n".join(f"    def method{i}(self): pass" for i in range(20))
+_GOD_METHOD_NAMES = [f"method{i}" for i in range(20)]
+_LONG_METHOD_SRC = "def long_method():\n" + "\n".join(f"    x{i} = {i}" for i in range(35))
+
+# Entity lists shared by the anti-pattern and duplicate tests; read-only
+_GOD_OBJECT_CLASSES = [
+    ClassInfo(name="GodObject", line_start=2, line_end=25, methods=_GOD_METHOD_NAMES)
+]
+_NORMAL_CLASSES = [
+    ClassInfo(name="Normal", line_start=2, line_end=7, methods=["method1", "method2"])
+]
+_NESTED_FUNCTIONS = [
+    FunctionInfo(name="nested", line_start=2, line_end=9, parameters=[])
+]
+_LONG_METHOD_FUNCTIONS = [
+    FunctionInfo(name="long_method", line_start=1, line_end=36, parameters=[])
+]
+_DUPLICATE_TRIO_FUNCTIONS = [
+    FunctionInfo(name="method_a", line_start=2, line_end=7, parameters=[]),
+    FunctionInfo(name="method_b", line_start=9, line_end=14, parameters=[]),
+    FunctionInfo(name="method_c", line_start=16, line_end=19, parameters=[]),
+]
+_IDENTICAL_PAIR_SRC = """
+def method_a():
+    total = 0
+    for value in range(10):
+        total += value * value
+    return total
+
+def method_b():
+    total = 0
+    for value in range(10):
+        total += value * value
+    return total
+"""
+_IDENTICAL_PAIR_FUNCTIONS = [
+    FunctionInfo(name="method_a", line_start=2, line_end=6, parameters=[]),
+    FunctionInfo(name="method_b", line_start=8, line_end=12, parameters=[]),
+]
+# beta renames every local of alpha; SequenceMatcher rates them ~0.94
+_RENAMED_CLONE_SRC = """
+def alpha(items):
+    value = items[0]
+    count = len(items)
+    result = value + count
+    return result
+
+def beta(items):
+    value1 = items[0]
+    count1 = len(items)
+    result1 = value1 + count1
+    return result1
+"""
+_RENAMED_CLONE_FUNCTIONS = [
+    FunctionInfo(name="alpha", line_start=2, line_end=6, parameters=[]),
+    FunctionInfo(name="beta", line_start=8, line_end=12, parameters=[]),
+]
+_DISTINCT_PAIR_FUNCTIONS = [
+    FunctionInfo(name="method_a", line_start=2, line_end=7, parameters=[]),
+    FunctionInfo(name="method_b", line_start=9, line_end=11, parameters=[]),
+]
 
 
 class TestAntiPatternDetection:
@@ -208,18 +297,13 @@ class TestAntiPatternDetection:
     def test_god_object_detected(self):
         """Test god object detection."""
         # Create a large class
-        methods = "\n".join([f"    def method{i}(self): pass" for i in range(20)])
         code = f"""
 class GodObject:
     def __init__(self):
         pass
-{methods}
+{_GOD_METHODS_SRC}
 """
-        classes = [
-            ClassInfo(name="GodObject", line_start=2, line_end=25, methods=[f"method{i}" for i in range(20)])
-        ]
-
-        anti_patterns, code_smells = detect_anti_patterns(code, classes, [])
+        anti_patterns, code_smells = detect_anti_patterns(code, _GOD_OBJECT_CLASSES, [])
 
         god_objects = [a for a in anti_patterns if a.anti_pattern_type == "god_object"]
         assert len(god_objects) > 0
@@ -235,27 +319,16 @@ def nested():
                     if True:
                         pass
 """
-        functions = [
-            FunctionInfo(name="nested", line_start=2, line_end=9, parameters=[])
-        ]
-
-        anti_patterns, code_smells = detect_anti_patterns(code, [], functions)
+        anti_patterns, code_smells = detect_anti_patterns(code, [], _NESTED_FUNCTIONS)
 
         spaghetti = [a for a in anti_patterns if a.anti_pattern_type == "spaghetti_code"]
         assert len(spaghetti) > 0
 
     def test_long_method_detected(self):
         """Test long method detection."""
-        lines = ["def long_method():"]
-        for i in range(35):
-            lines.append(f"    x{i} = {i}")
-        code = "\n".join(lines)
-
-        functions = [
-            FunctionInfo(name="long_method", line_start=1, line_end=36, parameters=[])
-        ]
-
-        anti_patterns, code_smells = detect_anti_patterns(code, [], functions)
+        anti_patterns, code_smells = detect_anti_patterns(
+            _LONG_METHOD_SRC, [], _LONG_METHOD_FUNCTIONS
+        )
 
         long_methods = [s for s in code_smells if s.smell_type == "long_method"]
         assert len(long_methods) > 0
@@ -270,16 +343,24 @@ class Normal:
     def method2(self):
         pass
 """
-        classes = [
-            ClassInfo(name="Normal", line_start=2, line_end=7, methods=["method1", "method2"])
-        ]
-
-        anti_patterns, code_smells = detect_anti_patterns(code, classes, [])
+        anti_patterns, code_smells = detect_anti_patterns(code, _NORMAL_CLASSES, [])
 
         # Should not have god_object or spaghetti_code
         assert not any(a.anti_pattern_type == "god_object" for a in anti_patterns)
         assert not any(a.anti_pattern_type == "spaghetti_code" for a in anti_patterns)
 
+    @pytest.mark.parametrize("functions,expected", [
+        pytest.param(_IDENTICAL_PAIR_FUNCTIONS, 1, id="pair"),
+        pytest.param(_IDENTICAL_PAIR_FUNCTIONS[:1], 0, id="single_function"),
+        pytest.param([], 0, id="no_functions"),
+    ])
+    def test_duplicate_code_smell(self, functions, expected):
+        """Test duplicate-code smells need at least two functions."""
+        _, code_smells = detect_anti_patterns(_IDENTICAL_PAIR_SRC, [], functions)
+
+        duplicates = [s for s in code_smells if s.smell_type == "duplicate_code"]
+        assert len(duplicates) == expected
+
 
 class TestDuplicateCodeDetection:
     """Test duplicate code detection."""
@@ -304,20 +385,32 @@ def method_c():
     b = 2
     return a + b
 """
-        functions = [
-            FunctionInfo(name="method_a", line_start=2, line_end=7, parameters=[]),
-            FunctionInfo(name="method_b", line_start=9, line_end=14, parameters=[]),
-            FunctionInfo(name="method_c", line_start=16, line_end=19, parameters=[]),
-        ]
-
         detector = DuplicateCodeDetector(similarity_threshold=0.7)
-        duplicates = detector.detect_duplicates(functions, code)
+        duplicates = detector.detect_duplicates(_DUPLICATE_TRIO_FUNCTIONS, code)
 
         assert len(duplicates) > 0
         # method_a and method_b should be detected as duplicates
         assert any("method_a" in str(dup.locations) and "method_b" in str(dup.locations)
                    for dup in duplicates)
 
+    def test_identical_methods_detected_at_default_threshold(self):
+        """Test that near-identical methods are detected at the default threshold."""
+        detector = DuplicateCodeDetector()
+        duplicates = detector.detect_duplicates(_IDENTICAL_PAIR_FUNCTIONS, _IDENTICAL_PAIR_SRC)
+
+        assert len(duplicates) == 1
+        assert duplicates[0].similarity >= DEFAULT_DUPLICATE_THRESHOLD
+        assert [loc[0] for loc in duplicates[0].locations] == ["method_a", "method_b"]
+
+    def test_renamed_identifier_clone_detected(self):
+        """Test that a clone differing only in local names is still reported."""
+        detector = DuplicateCodeDetector()
+        duplicates = detector.detect_duplicates(_RENAMED_CLONE_FUNCTIONS, _RENAMED_CLONE_SRC)
+
+        assert len(duplicates) == 1
+        assert duplicates[0].similarity > 0.9
+        assert [loc[0] for loc in duplicates[0].locations] == ["alpha", "beta"]
+
     def test_no_duplicates_simple(self):
         """Test that different methods aren't flagged."""
         code = """
@@ -331,16 +424,24 @@ def method_b():
     result = calculate()
     return process(result)
 """
-        functions = [
-            FunctionInfo(name="method_a", line_start=2, line_end=7, parameters=[]),
-            FunctionInfo(name="method_b", line_start=9, line_end=11, parameters=[]),
-        ]
-
         detector = DuplicateCodeDetector()
-        duplicates = detector.detect_duplicates(functions, code)
+        duplicates = detector.detect_duplicates(_DISTINCT_PAIR_FUNCTIONS, code)
 
         assert len(duplicates) == 0
 
+    @pytest.mark.parametrize("text1,text2", [
+        ("x = 1\nreturn x", "y = 2\nreturn y"),
+        ("return compute(a, b)", "return a + b"),
+        ("", "pass"),
+        ("", ""),
+    ])
+    def test_ratio_upper_bound_caps_ratio(self, text1, text2):
+        """Test that the character-frequency bound never undercuts ratio()."""
+        bound = _ratio_upper_bound(Counter(text1), Counter(text2), len(text1) + len(text2))
+
+        assert bound >= SequenceMatcher(None, text1, text2).ratio()
+        assert bound == SequenceMatcher(None, text1, text2).quick_ratio()
+
 
 class TestPatternReport:
     """Test pattern report generation."""
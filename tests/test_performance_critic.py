@@ -1,5 +1,8 @@
 """Tests for performance critic."""
 
+import ast
+from collections import defaultdict
+
 import pytest
 
 from backend.analysis.performance_critic import (
@@ -8,21 +11,10 @@ from backend.analysis.performance_critic import (
     analyze_performance_issues,
     generate_performance_report,
 )
-from backend.models import FunctionInfo
-
 
-class TestPerformanceIssueDetection:
-    """Test performance issue detection."""
 
-    def test_empty_code(self):
-        """Test with empty code."""
-        issues = analyze_performance_issues("", [])
-
-        assert issues == []
-
-    def test_n_plus_1_queries(self):
-        """Test N+1 query pattern detection."""
-        code = """
+# Snippets analyzed together in one pass; function names are unique
+_N_PLUS_1_SRC = """
 def process_users(users):
     results = []
     for user in users:
@@ -31,13 +23,8 @@ def process_users(users):
         results.append(orders)
     return results
 """
-        issues = analyze_performance_issues(code, [])
 
-        assert any(i.issue_type == "n_plus_1_queries" for i in issues)
-
-    def test_quadratic_nested_loops(self):
-        """Test nested loop detection."""
-        code = """
+_NESTED_LOOP_SRC = """
 def nested_loop(items):
     results = []
     for x in items:
@@ -45,50 +32,30 @@ def nested_loop(items):
             results.append((x, y))
     return results
 """
-        issues = analyze_performance_issues(code, [])
-
-        assert any(i.issue_type == "o_n_squared" for i in issues)
 
-    def test_resource_leak_open(self):
-        """Test resource leak detection with open()."""
-        code = """
+_OPEN_WITHOUT_WITH_SRC = """
 def read_file(path):
     f = open(path)  # No with statement
     return f.read()
 """
-        issues = analyze_performance_issues(code, [])
-
-        assert any(i.issue_type == "resource_leak_risk" for i in issues)
 
-    def test_inefficient_string_concat(self):
-        """Test string concatenation in loop."""
-        code = """
+_STRING_CONCAT_SRC = """
 def build_string(items):
     result = ""
     for item in items:
         result += item  # Inefficient
     return result
 """
-        issues = analyze_performance_issues(code, [])
 
-        assert any(i.issue_type == "inefficient_string_concat" for i in issues)
-
-    def test_list_insert_at_zero(self):
-        """Test insert at position 0 detection."""
-        code = """
+_INSERT_AT_ZERO_SRC = """
 def reverse_insert(items):
     result = []
     for item in items:
         result.insert(0, item)  # O(n) operation in loop
     return result
 """
-        issues = analyze_performance_issues(code, [])
-
-        assert any(i.issue_type == "inefficient_list_operation" for i in issues)
 
-    def test_missing_early_return(self):
-        """Test missing early return pattern."""
-        code = """
+_EARLY_RETURN_SRC = """
 def process(value):
     if value > 0:
         return "positive"
@@ -96,10 +63,85 @@ def process(value):
         result = "other"
     return result
 """
-        issues = analyze_performance_issues(code, [])
 
+_TRIPLE_LOOP_SRC = """
+def nested(items):
+    for x in items:
+        for y in items:
+            for z in items:
+                process(x, y, z)
+"""
+
+_METHOD_SRC = """
+class DataProcessor:
+    def process(self, items):
+        for item in items:
+            self.db.query(item)  # Potential N+1
+"""
+
+_NESTED_CLASS_SRC = """
+class Outer:
+    class Inner:
+        def method(self):
+            for x in items:
+                for y in items:
+                    pass
+"""
+
+_COMBINED_SRC = "\n".join([
+    _N_PLUS_1_SRC,
+    _NESTED_LOOP_SRC,
+    _OPEN_WITHOUT_WITH_SRC,
+    _STRING_CONCAT_SRC,
+    _INSERT_AT_ZERO_SRC,
+    _EARLY_RETURN_SRC,
+    _TRIPLE_LOOP_SRC,
+    _METHOD_SRC,
+    _NESTED_CLASS_SRC,
+])
+
+
+@pytest.fixture(scope="module")
+def issues_by_function():
+    """Performance issues for every snippet, grouped by function name."""
+    grouped = defaultdict(list)
+    for issue in analyze_performance_issues(_COMBINED_SRC, []):
+        grouped[issue.function_name].append(issue)
+    return grouped
+
+
+def _issue_types(issues_by_function, function_name):
+    """Return the issue types reported for one function."""
+    return {i.issue_type for i in issues_by_function[function_name]}
+
+
+class TestPerformanceIssueDetection:
+    """Test performance issue detection."""
+
+    def test_n_plus_1_queries(self, issues_by_function):
+        """Test N+1 query pattern detection."""
+        assert "n_plus_1_queries" in _issue_types(issues_by_function, "process_users")
+
+    def test_quadratic_nested_loops(self, issues_by_function):
+        """Test nested loop detection."""
+        assert "o_n_squared" in _issue_types(issues_by_function, "nested_loop")
+
+    def test_resource_leak_open(self, issues_by_function):
+        """Test resource leak detection with open()."""
+        assert "resource_leak_risk" in _issue_types(issues_by_function, "read_file")
+
+    def test_inefficient_string_concat(self, issues_by_function):
+        """Test string concatenation in loop."""
+        assert "inefficient_string_concat" in _issue_types(issues_by_function, "build_string")
+
+    def test_list_insert_at_zero(self, issues_by_function):
+        """Test insert at position 0 detection."""
+        assert "inefficient_list_operation" in _issue_types(issues_by_function, "reverse_insert")
+
+    def test_missing_early_return(self, issues_by_function):
+        """Test missing early return pattern."""
         # May or may not flag depending on structure
-        assert isinstance(issues, list)
+        assert isinstance(issues_by_function["process"], list)
 
 
 class TestPerformanceReport:
@@ -173,14 +215,28 @@ class TestPerformanceCriticClass:
     def test_visits_function(self):
         """Test that critic visits functions."""
         code = "def test(): return 1"
-        import ast
-
         tree = ast.parse(code)
         critic = PerformanceCritic(code)
         critic.visit(tree)
 
         assert isinstance(critic.issues, list)
 
+    def test_dispatch_table_includes_subclass_handlers(self):
+        """Test that subclasses get their own visit_* handlers dispatched."""
+        seen = []
+
+        class CallCounter(PerformanceCritic):
+            def visit_Call(self, node):
+                seen.append(node.func.id)
+                self.generic_visit(node)
+
+        code = "def run():\n    return helper()"
+        CallCounter(code).visit(ast.parse(code))
+
+        assert ast.FunctionDef in PerformanceCritic._DISPATCH
+        assert ast.Call not in PerformanceCritic._DISPATCH
+        assert seen == ["helper"]
+
 
 class TestPerformanceIssueDataclass:
     """Test PerformanceIssue dataclass."""
@@ -205,41 +261,53 @@ class TestPerformanceIssueDataclass:
         assert issue.confidence == "high"
 
 
-class TestEdgeCases:
-    """Test edge cases."""
-
-    def test_syntax_error_code(self):
-        """Test with syntax error."""
-        issues = analyze_performance_issues("def broken(", [])
+def _is_empty(issues):
+    """Predicate: no issues were reported."""
+    return issues == []
 
-        assert issues == []
 
-    def test_safe_code_no_issues(self):
-        """Test that safe code doesn't trigger false positives."""
-        code = """
-def safe_read(path):
-    with open(path) as f:
-        return f.read()
-"""
-        issues = analyze_performance_issues(code, [])
+def _is_list(issues):
+    """Predicate: the analysis returned a list."""
+    return isinstance(issues, list)
 
-        # Should not have resource leak for with statement
-        # (though our simplified detection might still flag it)
-        assert isinstance(issues, list)
 
-    def test_complex_function(self):
-        """Test analysis of complex function."""
-        code = """
-def complex_process(items):
-    results = []
-    for item in items:
-        for sub in item.children:
-            results.append(process(sub))
-    return results
-"""
-        issues = analyze_performance_issues(code, [])
+class TestEdgeCases:
+    """Test edge cases."""
 
-        assert isinstance(issues, list)
+    @pytest.mark.parametrize("code,predicate", [
+        pytest.param("", _is_empty, id="empty_code"),
+        pytest.param("def broken(", _is_empty, id="syntax_error"),
+        # with-managed open() should not leak, though the simplified
+        # detection might still flag it
+        pytest.param(
+            "def safe_read(path):\n"
+            "    with open(path) as f:\n"
+            "        return f.read()\n",
+            _is_list,
+            id="safe_code",
+        ),
+        pytest.param(
+            "def complex_process(items):\n"
+            "    results = []\n"
+            "    for item in items:\n"
+            "        for sub in item.children:\n"
+            "            results.append(process(sub))\n"
+            "    return results\n",
+            _is_list,
+            id="complex_function",
+        ),
+        pytest.param("def dummy(): pass", _is_list, id="trivial_function"),
+        pytest.param(
+            "def single_loop(items):\n"
+            "    for x in items:\n"
+            "        process(x)\n",
+            _is_list,
+            id="single_loop",
+        ),
+    ])
+    def test_returns_list(self, code, predicate):
+        """Test that small and malformed inputs return a well-formed list."""
+        assert predicate(analyze_performance_issues(code, []))
 
 
 class TestSpecificIssueTypes:
@@ -247,9 +315,6 @@ class TestSpecificIssueTypes:
 
     def test_all_severity_levels(self):
         """Test all severity levels are supported."""
-        code = "def dummy(): pass"
-        issues = analyze_performance_issues(code, [])
-
         # Should handle all severity levels
         for severity in ["low", "medium", "high"]:
             issue = PerformanceIssue(
@@ -294,59 +359,23 @@ class TestConfidenceLevels:
 class TestLoopDepthTracking:
     """Test loop depth tracking for context-sensitive analysis."""
 
-    def test_single_loop(self):
-        """Test single loop tracking."""
-        code = """
-def single_loop(items):
-    for x in items:
-        process(x)
-"""
-        issues = analyze_performance_issues(code, [])
-
-        assert isinstance(issues, list)
-
-    def test_nested_loops(self):
+    def test_nested_loops(self, issues_by_function):
         """Test nested loop tracking."""
-        code = """
-def nested(items):
-    for x in items:
-        for y in items:
-            for z in items:
-                process(x, y, z)
-"""
-        issues = analyze_performance_issues(code, [])
-
         # Should detect multiple O(n²) patterns
-        o_n_squared_issues = [i for i in issues if i.issue_type == "o_n_squared"]
+        o_n_squared_issues = [
+            i for i in issues_by_function["nested"] if i.issue_type == "o_n_squared"
+        ]
         assert len(o_n_squared_issues) >= 1
 
 
 class TestClassContext:
     """Test class method analysis."""
 
-    def test_method_analysis(self):
+    def test_method_analysis(self, issues_by_function):
         """Test that methods are analyzed correctly."""
-        code = """
-class DataProcessor:
-    def process(self, items):
-        for item in items:
-            self.db.query(item)  # Potential N+1
-"""
-        issues = analyze_performance_issues(code, [])
+        # Should detect issues in methods, qualified by their class
+        assert "n_plus_1_queries" in _issue_types(issues_by_function, "DataProcessor.process")
 
-        # Should detect issues in methods
-        assert isinstance(issues, list)
-
-    def test_nested_class(self):
+    def test_nested_class(self, issues_by_function):
         """Test nested class handling."""
-        code = """
-class Outer:
-    class Inner:
-        def method(self):
-            for x in items:
-                for y in items:
-                    pass
-"""
-        issues = analyze_performance_issues(code, [])
-
-        assert isinstance(issues, list)
+        assert "o_n_squared" in _issue_types(issues_by_function, "Inner.method")
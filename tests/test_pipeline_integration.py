@@ -1,16 +1,38 @@
 """End-to-end integration tests for the verification pipeline."""
 
+import ast
+import asyncio
+import os
+from functools import lru_cache
+
 import pytest
 
 from backend.analysis.ast_parser import parse_python_file
-from backend.pipeline.analyzer import analyze_python_file_sync, run_null_safety_check
+from backend.analysis.fact_extractor import extract_function_facts
+from backend.pipeline.analyzer import (
+    analyze_ast,
+    analyze_python_file_sync,
+    run_null_safety_check,
+)
+from backend.pipeline.report_generator import (
+    format_report_text,
+    generate_report,
+    load_report_json,
+    save_report_json,
+)
 from backend.llm import StubLLMAdapter
+from backend.models import FindingConfidence, FindingTier, VerificationIssue
+
+
+def _title_blob(report):
+    """Lowercased issue titles of a report, joined for substring checks."""
+    return " | ".join(i.title.lower() for i in report.issues)
 
 
 class TestPipelineIntegration:
     """End-to-end pipeline tests."""
 
-    def test_analyze_simple_file(self):
+    def test_analyze_simple_file(self, analyzed):
         """Test analyzing a simple Python file."""
         code = """
 def add(a: int, b: int) -> int:
@@ -21,52 +43,30 @@ def divide(a: int, b: int) -> float:
     '''Divide two numbers.'''
     return a / b
 """
-        # Write to temp file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
-
-        try:
-            report = analyze_python_file_sync(temp_path)
-
-            assert report.function_count == 2
-            assert "add" in report.functions_analyzed
-            assert "divide" in report.functions_analyzed
-            assert len(report.issues) >= 0  # May have issues or not
+        report = analyzed(code)
 
-        finally:
-            import os
-            os.unlink(temp_path)
+        assert report.function_count == 2
+        assert "add" in report.functions_analyzed
+        assert "divide" in report.functions_analyzed
+        assert len(report.issues) >= 0  # May have issues or not
 
-    def test_analyze_vulnerable_code(self, vulnerable_code: str):
+    def test_analyze_vulnerable_code(self, analyzed, vulnerable_code: str):
         """Test analyzing code with security vulnerabilities."""
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(vulnerable_code)
-            temp_path = f.name
+        report = analyzed(vulnerable_code)
 
-        try:
-            report = analyze_python_file_sync(temp_path)
+        # Should detect command injection
+        titles = _title_blob(report)
+        assert "command" in titles or "injection" in titles
 
-            # Should detect command injection
-            assert any("command" in i.title.lower() or "injection" in i.title.lower()
-                      for i in report.issues)
+        # Should have security issues
+        assert any(i.category == "security" for i in report.issues)
 
-            # Should have security issues
-            assert any(i.category == "security" for i in report.issues)
-
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_analyze_conftest_file(self):
+    def test_analyze_conftest_file(self, async_runner):
         """Test analyzing the conftest.py fixture file."""
-        import os
         conftest_path = os.path.join(os.path.dirname(__file__), "conftest.py")
 
         if os.path.exists(conftest_path):
-            report = analyze_python_file_sync(conftest_path)
+            report = analyze_python_file_sync(conftest_path, runner=async_runner)
 
             # Should analyze the fixture functions themselves
             assert report.function_count >= 3  # sample_python_code, vulnerable_code, complex_code
@@ -75,30 +75,42 @@ def divide(a: int, b: int) -> float:
             # They don't have issues (the issues are in the returned code strings)
             # This test just verifies we can analyze the file without crashing
 
-    def test_report_has_required_fields(self):
+    def test_analyze_ast_matches_file_analysis(
+        self, analyzed, async_runner, vulnerable_code: str
+    ):
+        """Test that analyzing a parsed tree finds the same issues as the file path."""
+        from_file = analyzed(vulnerable_code)
+        from_tree = async_runner.run(analyze_ast(ast.parse(vulnerable_code), vulnerable_code))
+
+        assert from_tree.file_path == "<memory>"
+        assert from_tree.functions_analyzed == from_file.functions_analyzed
+        assert [i.issue_id for i in from_tree.issues] == [i.issue_id for i in from_file.issues]
+
+    def test_sync_wrapper_reuses_runner_loop(self, code_file):
+        """Test that a passed runner's loop serves repeated calls and stays open."""
+        path = str(code_file("def test(): pass"))
+        with asyncio.Runner() as runner:
+            first = analyze_python_file_sync(path, runner=runner)
+            second = analyze_python_file_sync(path, runner=runner)
+
+            assert not runner.get_loop().is_closed()
+
+        assert first.functions_analyzed == second.functions_analyzed == ["test"]
+
+    def test_report_has_required_fields(self, analyzed):
         """Test that report has all required fields."""
         code = "def test(): pass"
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
-
-        try:
-            report = analyze_python_file_sync(temp_path)
-
-            assert report.analysis_id
-            assert report.timestamp
-            assert report.code_hash
-            assert report.file_path
-            assert report.language == "python"
-            assert report.metrics is not None
-            assert isinstance(report.functions_analyzed, list)
-
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_report_metrics_are_correct(self):
+        report = analyzed(code)
+
+        assert report.analysis_id
+        assert report.timestamp
+        assert report.code_hash
+        assert report.file_path
+        assert report.language == "python"
+        assert report.metrics is not None
+        assert isinstance(report.functions_analyzed, list)
+
+    def test_report_metrics_are_correct(self, analyzed):
         """Test that report metrics are calculated correctly."""
         code = """
 def func1():
@@ -113,106 +125,80 @@ def func2():
 def func3(items=[]):
     pass
 """
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
-
-        try:
-            report = analyze_python_file_sync(temp_path)
+        report = analyzed(code)
 
-            metrics = report.metrics
-            assert metrics["function_count"] == 3
-            assert metrics["tier2_findings"] >= 0  # Should have some issues
-            assert "issue_count" in metrics
+        metrics = report.metrics
+        assert metrics["function_count"] == 3
+        assert metrics["tier2_findings"] >= 0  # Should have some issues
+        assert "issue_count" in metrics
 
-        finally:
-            import os
-            os.unlink(temp_path)
-
-
-class TestNullSafetyCheckIntegration:
-    """Integration tests for null safety check with LLM."""
 
-    @pytest.mark.asyncio
-    async def test_null_safety_unsafe_function(self):
-        """Test null safety check on unsafe function."""
-        code = "def greet(name): return name.upper()"
-        import ast
+@lru_cache(maxsize=64)
+def _parsed(code):
+    """Parse code once and return (tree, first top-level function or None).
 
-        tree, _ = parse_python_file(code)
-        func_node = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_node = node
-                break
+    Trees are shared between callers and must not be mutated.
+    """
+    tree, _ = parse_python_file(code)
+    # Snippets define their function at module level; no need to walk
+    func_node = next((n for n in tree.body if isinstance(n, ast.FunctionDef)), None)
+    return tree, func_node
 
-        from backend.analysis.fact_extractor import extract_function_facts
-        facts = extract_function_facts(func_node, code)
 
-        stub = StubLLMAdapter({
-            "null safety": "UNSAFE: name (calls .upper() without None check)"
-        })
+def _function_facts(code):
+    """Extract facts for the first function defined in code."""
+    _, func_node = _parsed(code)
+    return extract_function_facts(func_node, code)
 
-        issues = await run_null_safety_check(facts, stub)
 
-        # Should find null safety issue
-        assert len(issues) > 0
-        assert "null_safety" in issues[0].issue_id
+# One stub answers every case. Each case defines a function name of its
+# own, absent from the prompt's few-shot examples, and the stub keys on it
+_NULL_SAFETY_RESPONSES = {
+    "def guarded_greet(": "SAFE: all parameters handled",
+    "def shout(": "UNSAFE: name (calls .upper() without None check)",
+}
 
-    @pytest.mark.asyncio
-    async def test_null_safety_safe_function(self):
-        """Test null safety check on safe function."""
-        code = """
-def greet(name):
+# (code, expect an issue)
+_NULL_SAFETY_CASES = {
+    "unsafe_function": ("def shout(name): return name.upper()", True),
+    "safe_function": (
+        """
+def guarded_greet(name):
     if name is None:
         return "Hello, stranger"
     return name.upper()
-"""
-        import ast
-
-        tree, _ = parse_python_file(code)
-        func_node = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_node = node
-                break
-
-        from backend.analysis.fact_extractor import extract_function_facts
-        facts = extract_function_facts(func_node, code)
-
-        stub = StubLLMAdapter({
-            "null safety": "SAFE: all parameters handled"
-        })
+""",
+        False,
+    ),
+    # No key matches: default UNCLEAR response means no finding
+    "unclear_response": ("def complex_func(data): return data", False),
+}
 
-        issues = await run_null_safety_check(facts, stub)
 
-        # Should not find issues (function is safe)
-        assert len(issues) == 0
+@pytest.fixture(scope="module")
+def null_safety_stub():
+    """Stub LLM adapter serving all null safety cases."""
+    return StubLLMAdapter(_NULL_SAFETY_RESPONSES)
 
-    @pytest.mark.asyncio
-    async def test_null_safety_unclear_response(self):
-        """Test null safety check when LLM is unclear."""
-        code = "def complex_func(data): return data"
-        import ast
 
-        tree, _ = parse_python_file(code)
-        func_node = None
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_node = node
-                break
-
-        from backend.analysis.fact_extractor import extract_function_facts
-        facts = extract_function_facts(func_node, code)
+class TestNullSafetyCheckIntegration:
+    """Integration tests for null safety check with LLM."""
 
-        # Use default UNCLEAR response
-        stub = StubLLMAdapter({})
+    async def test_null_safety_batch(self, null_safety_stub):
+        """Test unsafe, safe and unclear null safety checks in one event loop."""
+        cases = list(_NULL_SAFETY_CASES.items())
 
-        issues = await run_null_safety_check(facts, stub)
+        results = await asyncio.gather(*[
+            run_null_safety_check(_function_facts(code), null_safety_stub)
+            for _, (code, _) in cases
+        ])
 
-        # Should not find issues (unclear means no finding)
-        assert len(issues) == 0
+        for (case_id, (_, expect_issues)), issues in zip(cases, results, strict=True):
+            if expect_issues:
+                assert len(issues) > 0, case_id
+                assert "null_safety" in issues[0].issue_id, case_id
+            else:
+                assert len(issues) == 0, case_id
 
 
 class TestReportFormatting:
@@ -220,9 +206,6 @@ class TestReportFormatting:
 
     def test_format_report_text_no_issues(self):
         """Test formatting a report with no issues."""
-        from backend.pipeline.report_generator import format_report_text, generate_report
-        from backend.models import VerificationIssue
-
         report = generate_report(
             file_path="test.py",
             source_code="def test(): pass",
@@ -238,9 +221,6 @@ class TestReportFormatting:
 
     def test_format_report_text_with_issues(self):
         """Test formatting a report with issues."""
-        from backend.pipeline.report_generator import format_report_text, generate_report
-        from backend.models import VerificationIssue, FindingTier, FindingConfidence
-
         issues = [
             VerificationIssue(
                 issue_id="test:issue1",
@@ -279,12 +259,8 @@ class TestReportFormatting:
         assert "Test Issue 1" in text
         assert "Test Issue 2" in text
 
-    def test_save_and_load_report_json(self):
+    def test_save_and_load_report_json(self, tmp_path):
         """Test saving and loading a JSON report."""
-        from backend.pipeline.report_generator import generate_report, save_report_json, load_report_json
-        import tempfile
-        import os
-
         report = generate_report(
             file_path="test.py",
             source_code="def test(): pass",
@@ -292,47 +268,31 @@ class TestReportFormatting:
             issues=[]
         )
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            save_report_json(report, temp_path)
-            loaded = load_report_json(temp_path)
+        temp_path = str(tmp_path / "report.json")
+        save_report_json(report, temp_path)
+        loaded = load_report_json(temp_path)
 
-            assert loaded.analysis_id == report.analysis_id
-            assert loaded.file_path == report.file_path
-            assert loaded.code_hash == report.code_hash
-
-        finally:
-            os.unlink(temp_path)
+        assert loaded.analysis_id == report.analysis_id
+        assert loaded.file_path == report.file_path
+        assert loaded.code_hash == report.code_hash
 
 
 class TestRealCodeAnalysis:
     """Test analysis on real code patterns."""
 
-    def test_analyze_mutable_default_function(self):
+    def test_analyze_mutable_default_function(self, analyzed):
         """Test function with mutable default argument."""
         code = """
 def append_item(items=[]):
     items.append(1)
     return items
 """
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
-
-        try:
-            report = analyze_python_file_sync(temp_path)
+        report = analyzed(code)
 
-            # Should detect mutable default issue
-            assert any("mutable" in i.title.lower() for i in report.issues)
+        # Should detect mutable default issue
+        assert "mutable" in _title_blob(report)
 
-        finally:
-            import os
-            os.unlink(temp_path)
-
-    def test_analyze_bare_except_function(self):
+    def test_analyze_bare_except_function(self, analyzed):
         """Test function with bare except clause."""
         code = """
 def risky_operation():
@@ -341,43 +301,23 @@ def risky_operation():
     except:
         pass
 """
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
+        report = analyzed(code)
 
-        try:
-            report = analyze_python_file_sync(temp_path)
+        # Should detect bare except issue
+        titles = _title_blob(report)
+        assert "bare except" in titles or "bare" in titles
 
-            # Should detect bare except issue
-            assert any("bare except" in i.title.lower() or "bare" in i.title.lower()
-                      for i in report.issues)
+    async def test_analyze_giant_function(self):
+        """Test analysis of a function that exceeds size thresholds."""
+        # Create a function with >50 lines, analyzed in memory
+        code = (
+            "def giant_function():\n"
+            + "".join(f"    x{i} = {i}\n" for i in range(50))
+            + "    return 0"
+        )
 
-        finally:
-            import os
-            os.unlink(temp_path)
+        report = await analyze_ast(ast.parse(code), code)
 
-    def test_analyze_giant_function(self):
-        """Test analysis of a function that exceeds size thresholds."""
-        # Create a function with >50 lines
-        lines = ["def giant_function():"]
-        for i in range(50):
-            lines.append(f"    x{i} = {i}")
-        lines.append("    return 0")
-        code = "\n".join(lines)
-
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_path = f.name
-
-        try:
-            report = analyze_python_file_sync(temp_path)
-
-            # Should detect giant function issue
-            assert any("giant" in i.title.lower() or "size" in i.title.lower() or "threshold" in i.title.lower()
-                      for i in report.issues)
-
-        finally:
-            import os
-            os.unlink(temp_path)
+        # Should detect giant function issue
+        titles = _title_blob(report)
+        assert any(k in titles for k in ("giant", "size", "threshold"))
@@ -1,16 +1,68 @@
 """Tests for refactoring suggester."""
 
+import ast
+import dataclasses
+
 import pytest
 
+from backend.analysis.common import parse_cached
 from backend.models import FunctionInfo
 from backend.synthesis.refactoring_suggester import (
     RefactoringSuggestion,
     RefactoringSuggester,
     generate_refactoring_report,
     suggest_refactorings,
+    suggest_refactorings_ast,
 )
 
 
+_LONG_FUNCTION_SRC = (
+    "def long_function():\n"
+    '    """A very long function."""\n'
+    + "".join(f"    x = {i}\n" for i in range(1, 32))
+    + "    return x\n"
+)
+
+_SUGGESTION_SNIPPETS = {
+    "long_function": _LONG_FUNCTION_SRC,
+    "parameter_object": """
+def func(a, b, c, d, e, f):
+    return a + b + c + d + e + f
+""",
+    "chained_if": """
+def chained_if(x):
+    if x > 10:
+        return "large"
+    elif x > 0:
+        return "medium"
+    else:
+        return "small"
+""",
+    "magic_number": """
+def calculate():
+    result = 42 * 3.14159
+    return result
+""",
+    "short_function": """
+def add(x, y):
+    return x + y
+""",
+    "class_method": """
+class MyClass:
+    def long_method(self):
+        x = 1
+        # ... many lines
+        return x
+""",
+}
+
+
+@pytest.fixture(scope="session")
+def suggestion_trees():
+    """Each suggestion snippet parsed exactly once per session."""
+    return {name: ast.parse(src) for name, src in _SUGGESTION_SNIPPETS.items()}
+
+
 class TestRefactoringSuggestions:
     """Test refactoring suggestion generation."""
 
@@ -20,96 +72,41 @@ class TestRefactoringSuggestions:
 
         assert suggestions == []
 
-    def test_long_function_suggestion(self):
+    def test_long_function_suggestion(self, suggestion_trees):
         """Test extract method suggestion for long function."""
-        code = """
-def long_function():
-    '''A very long function.'''
-    x = 1
-    x = 2
-    x = 3
-    x = 4
-    x = 5
-    x = 6
-    x = 7
-    x = 8
-    x = 9
-    x = 10
-    x = 11
-    x = 12
-    x = 13
-    x = 14
-    x = 15
-    x = 16
-    x = 17
-    x = 18
-    x = 19
-    x = 20
-    x = 21
-    x = 22
-    x = 23
-    x = 24
-    x = 25
-    x = 26
-    x = 27
-    x = 28
-    x = 29
-    x = 30
-    x = 31
-    return x
-"""
-        suggestions = suggest_refactorings(code, [])
+        suggestions = suggest_refactorings_ast(suggestion_trees["long_function"], [])
 
         assert any(s.suggestion_type == "extract_method" for s in suggestions)
 
-    def test_parameter_object_suggestion(self):
+    def test_parameter_object_suggestion(self, suggestion_trees):
         """Test parameter object suggestion for functions with many params."""
-        code = """
-def func(a, b, c, d, e, f):
-    return a + b + c + d + e + f
-"""
-        suggestions = suggest_refactorings(code, [])
+        suggestions = suggest_refactorings_ast(suggestion_trees["parameter_object"], [])
 
         assert any(s.suggestion_type == "parameter_object" for s in suggestions)
 
-    def test_simplify_conditional_suggestion(self):
-        """Test conditional simplification suggestion."""
-        code = """
-def chained_if(x):
-    if x > 10:
-        return "large"
-    elif x > 0:
-        return "medium"
-    else:
-        return "small"
-"""
-        suggestions = suggest_refactorings(code, [])
-
-        # May suggest simplification based on structure
-        assert isinstance(suggestions, list)
-
-    def test_magic_number_suggestion(self):
-        """Test magic number replacement suggestion."""
-        code = """
-def calculate():
-    result = 42 * 3.14159
-    return result
-"""
-        suggestions = suggest_refactorings(code, [])
-
-        # May suggest replacing magic numbers
-        assert isinstance(suggestions, list)
-
-    def test_short_function_no_suggestions(self):
-        """Test that short, clean functions don't trigger suggestions."""
-        code = """
-def add(x, y):
-    return x + y
-"""
-        suggestions = suggest_refactorings(code, [])
+    @pytest.mark.parametrize("name,expected_types", [
+        pytest.param(
+            "chained_if", {"simplify_conditional", "replace_magic_number"}, id="chained_if"
+        ),
+        pytest.param("magic_number", {"replace_magic_number"}, id="magic_number"),
+        pytest.param("short_function", set(), id="short_function"),
+        pytest.param("class_method", set(), id="short_class_method"),
+    ])
+    def test_suggestion_types(self, suggestion_trees, name, expected_types):
+        """Test the exact suggestion types produced for each snippet."""
+        suggestions = suggest_refactorings_ast(suggestion_trees[name], [])
+
+        assert {s.suggestion_type for s in suggestions} == expected_types
+
+    @pytest.mark.parametrize("name", sorted(_SUGGESTION_SNIPPETS))
+    def test_ast_entrypoint_matches_source(self, suggestion_trees, name):
+        """Test that a parsed tree yields the same suggestions as its source."""
+        from_source = suggest_refactorings(_SUGGESTION_SNIPPETS[name], [])
+        from_tree = suggest_refactorings_ast(
+            suggestion_trees[name], [], _SUGGESTION_SNIPPETS[name]
+        )
 
-        # Should be minimal or no suggestions
-        assert isinstance(suggestions, list)
+        assert from_tree == from_source
 
 
 class TestRefactoringReport:
@@ -185,9 +182,7 @@ class TestRefactoringSuggesterClass:
     def test_visits_function(self):
         """Test that suggester visits functions."""
         code = "def test(): return 1"
-        import ast
-
-        tree = ast.parse(code)
+        tree = parse_cached(code)
         suggester = RefactoringSuggester(code)
         suggester.visit(tree)
 
@@ -242,49 +237,31 @@ class TestEdgeCases:
 
         assert suggestions == []
 
-    def test_class_method(self):
-        """Test suggestion for class methods."""
-        code = """
-class MyClass:
-    def long_method(self):
-        x = 1
-        # ... many lines
-        return x
-"""
-        suggestions = suggest_refactorings(code, [])
 
-        assert isinstance(suggestions, list)
+_BASE_SUGGESTION = RefactoringSuggestion(
+    suggestion_id="test",
+    suggestion_type="test",
+    function_name="func",
+    line_start=1,
+    line_end=1,
+    description="desc",
+    suggested_code="code",
+)
 
 
 class TestConfidenceAndEffort:
     """Test confidence and effort levels."""
 
-    def test_all_confidence_levels(self):
+    @pytest.mark.parametrize("confidence", ["low", "medium", "high"])
+    def test_all_confidence_levels(self, confidence):
         """Test all confidence levels are supported."""
-        for confidence in ["low", "medium", "high"]:
-            suggestion = RefactoringSuggestion(
-                suggestion_id="test",
-                suggestion_type="test",
-                function_name="func",
-                line_start=1,
-                line_end=1,
-                description="desc",
-                suggested_code="code",
-                confidence=confidence,
-            )
-            assert suggestion.confidence == confidence
+        suggestion = dataclasses.replace(_BASE_SUGGESTION, confidence=confidence)
+
+        assert suggestion.confidence == confidence
 
-    def test_all_effort_levels(self):
+    @pytest.mark.parametrize("effort", ["low", "medium", "high"])
+    def test_all_effort_levels(self, effort):
         """Test all effort levels are supported."""
-        for effort in ["low", "medium", "high"]:
-            suggestion = RefactoringSuggestion(
-                suggestion_id="test",
-                suggestion_type="test",
-                function_name="func",
-                line_start=1,
-                line_end=1,
-                description="desc",
-                suggested_code="code",
-                effort=effort,
-            )
-            assert suggestion.effort == effort
+        suggestion = dataclasses.replace(_BASE_SUGGESTION, effort=effort)
+
+        assert suggestion.effort == effort
@@ -1,9 +1,10 @@
 """Tests for report exporter."""
 
+import dataclasses
 import json
+
 import pytest
 
-from backend.analysis.unified_analyzer import analyze_code
 from backend.parsing.report_exporter import (
     ReportExporter,
     export_report,
@@ -11,29 +12,87 @@ from backend.parsing.report_exporter import (
 )
 
 
+# Shared by several tests, so the memoized analysis is reused
+_DIVIDE_SRC = """
+def divide(x, y):
+    return x / y
+"""
+
+
+@pytest.fixture(scope="module")
+def foo_result(unified_analyzed):
+    """Analysis of the trivial 'def foo(): return 1' snippet, computed once."""
+    return unified_analyzed("def foo(): return 1")
+
+
+@pytest.fixture(scope="module")
+def foo_exporter(foo_result):
+    """Exporter over foo_result, shared by read-only export tests."""
+    return ReportExporter(foo_result)
+
+
+@pytest.fixture(scope="module")
+def exported(foo_result):
+    """Return a helper giving export_report output for foo_result per format."""
+    cache = {}
+
+    def get(fmt):
+        if fmt not in cache:
+            cache[fmt] = export_report(foo_result, format=fmt)
+        return cache[fmt]
+
+    return get
+
+
 class TestReportExporter:
     """Test report exporter."""
 
-    def test_to_json(self):
+    def test_to_json(self, foo_result, foo_exporter):
         """Test JSON export."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        json_str = exporter.to_json()
+        json_str = foo_exporter.to_json()
 
         assert isinstance(json_str, str)
         data = json.loads(json_str)
-        assert data["analysis_id"] == result.analysis_id
+        assert data["analysis_id"] == foo_result.analysis_id
         assert data["file_path"] == "unknown.py"
 
-    def test_to_sarif(self):
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_to_json_indent_variants_agree(self, foo_exporter, indent):
+        """Test that every indent setting yields the same JSON document."""
+        json_str = foo_exporter.to_json(indent=indent)
+
+        assert json.loads(json_str) == json.loads(foo_exporter.to_json())
+        assert ("\n" in json_str) == (indent is not None)
+
+    @pytest.mark.parametrize("fmt", ["json", "console", "html"])
+    def test_formats_serialized_once(self, foo_exporter, fmt):
+        """Test that repeated to_* calls return the cached rendering."""
+        render = getattr(foo_exporter, f"to_{fmt}")
+
+        assert render() is render()
+        assert render() is getattr(foo_exporter, fmt)
+
+    def test_sarif_serialized_once(self, foo_exporter):
+        """Test that the SARIF JSON is cached and carries to_sarif's results."""
+        assert foo_exporter.sarif is foo_exporter.sarif
+
+        # endTimeUtc is stamped per build, so compare the findings
+        sarif = json.loads(foo_exporter.sarif)
+        assert sarif["version"] == "2.1.0"
+        assert sarif["runs"][0]["results"] == foo_exporter.to_sarif()["runs"][0]["results"]
+
+    def test_to_sarif_mutation_does_not_leak(self, foo_result):
+        """Test that modifying one to_sarif result leaves later exports intact."""
+        exporter = ReportExporter(foo_result)
+
+        exporter.to_sarif()["runs"].clear()
+
+        assert len(exporter.to_sarif()["runs"]) == 1
+        assert len(json.loads(exporter.sarif)["runs"]) == 1
+
+    def test_to_sarif(self, unified_analyzed):
         """Test SARIF export."""
-        code = """
-def divide(x, y):
-    return x / y
-"""
-        result = analyze_code(code)
+        result = unified_analyzed(_DIVIDE_SRC)
 
         exporter = ReportExporter(result)
         sarif = exporter.to_sarif()
@@ -43,92 +102,52 @@ def divide(x, y):
         assert "runs" in sarif
         assert len(sarif["runs"]) == 1
 
-    def test_to_console(self):
+    def test_to_console(self, foo_result, foo_exporter):
         """Test console report formatting."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        console = exporter.to_console()
+        console = foo_exporter.to_console()
 
         assert isinstance(console, str)
         assert "P.Mill Analysis Report" in console
-        assert result.file_path in console
+        assert foo_result.file_path in console
 
-    def test_to_html(self):
+    def test_to_html(self, foo_result, foo_exporter):
         """Test HTML report generation."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        html = exporter.to_html()
+        html = foo_exporter.to_html()
 
         assert isinstance(html, str)
         assert "<!DOCTYPE html>" in html
         assert "P.Mill Analysis Report" in html
-        assert result.file_path in html
+        assert foo_result.file_path in html
 
 
 class TestExportReport:
     """Test export_report function."""
 
-    def test_export_json(self):
-        """Test JSON export via export_report."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        json_str = export_report(result, format="json")
-
-        data = json.loads(json_str)
-        assert data["analysis_id"] == result.analysis_id
-
-    def test_export_console(self):
-        """Test console format export."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        console = export_report(result, format="console")
+    @pytest.mark.parametrize("fmt,needles", [
+        pytest.param("json", ('"analysis_id": "{analysis_id}"',), id="json"),
+        pytest.param("console", ("P.Mill Analysis Report",), id="console"),
+        pytest.param("html", ("<!DOCTYPE html>", "P.Mill Analysis Report"), id="html"),
+        pytest.param("sarif", ('"version": "2.1.0"',), id="sarif"),
+    ])
+    def test_export_formats(self, foo_result, exported, fmt, needles):
+        """Test each export format via export_report."""
+        output = exported(fmt)
 
-        assert "P.Mill Analysis Report" in console
-
-    def test_export_html(self):
-        """Test HTML export."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        html = export_report(result, format="html")
-
-        assert "<!DOCTYPE html>" in html
-        assert "P.Mill Analysis Report" in html
-
-    def test_export_sarif(self):
-        """Test SARIF export."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        sarif = export_report(result, format="sarif")
-
-        data = json.loads(sarif)
-        assert data["version"] == "2.1.0"
+        for needle in needles:
+            assert needle.format(analysis_id=foo_result.analysis_id) in output
 
-    def test_unknown_format_raises_error(self):
+    def test_unknown_format_raises_error(self, foo_result):
         """Test that unknown format raises ValueError."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
         with pytest.raises(ValueError, match="Unknown format"):
-            export_report(result, format="unknown")
+            export_report(foo_result, format="unknown")
 
 
 class TestFormatConsoleReport:
     """Test format_console_report convenience function."""
 
-    def test_format_console_report(self):
+    def test_format_console_report(self, foo_result):
         """Test console report formatting."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        console = format_console_report(result)
+        console = format_console_report(foo_result)
 
         assert isinstance(console, str)
         assert "P.Mill Analysis Report" in console
@@ -137,7 +156,7 @@ class TestFormatConsoleReport:
 class TestReportWithIssues:
     """Test reports with actual issues."""
 
-    def test_console_shows_issues(self):
+    def test_console_shows_issues(self, unified_analyzed):
         """Test that console report shows issues."""
         code = """
 def divide(x, y):
@@ -147,20 +166,16 @@ def insecure():
     sql = "SELECT * FROM users WHERE id = %s" % user_input
     return sql
 """
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         console = ReportExporter(result).to_console()
 
         # Should show issues
         assert "SUMMARY" in console
 
-    def test_json_includes_issues(self):
+    def test_json_includes_issues(self, unified_analyzed):
         """Test that JSON includes issues."""
-        code = """
-def divide(x, y):
-    return x / y
-"""
-        result = analyze_code(code)
+        result = unified_analyzed(_DIVIDE_SRC)
 
         json_str = ReportExporter(result).to_json()
         data = json.loads(json_str)
@@ -168,13 +183,9 @@ def divide(x, y):
         assert "issues" in data
         assert "logic" in data["issues"]
 
-    def test_sarif_includes_results(self):
+    def test_sarif_includes_results(self, unified_analyzed):
         """Test that SARIF includes results."""
-        code = """
-def divide(x, y):
-    return x / y
-"""
-        result = analyze_code(code)
+        result = unified_analyzed(_DIVIDE_SRC)
 
         sarif = ReportExporter(result).to_sarif()
 
@@ -184,57 +195,63 @@ def divide(x, y):
 class TestSeverityMapping:
     """Test severity to SARIF level mapping."""
 
-    def test_critical_to_error(self):
-        """Test critical severity maps to error level."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        assert exporter._map_severity_to_level("critical") == "error"
-
-    def test_high_to_error(self):
-        """Test high severity maps to error level."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        assert exporter._map_severity_to_level("high") == "error"
-
-    def test_medium_to_warning(self):
-        """Test medium severity maps to warning level."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        assert exporter._map_severity_to_level("medium") == "warning"
-
-    def test_low_to_note(self):
-        """Test low severity maps to note level."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
-
-        exporter = ReportExporter(result)
-        assert exporter._map_severity_to_level("low") == "note"
+    @pytest.mark.parametrize("severity,expected", [
+        ("critical", "error"),
+        ("high", "error"),
+        ("medium", "warning"),
+        ("low", "note"),
+        ("unknown", "note"),
+    ])
+    def test_severity_mapping(self, severity, expected):
+        """Test each severity maps to its SARIF level without an exporter."""
+        assert ReportExporter._map_severity_to_level(severity) == expected
 
 
 class TestEdgeCases:
     """Test edge cases."""
 
-    def test_empty_analysis(self):
+    def test_empty_analysis(self, unified_analyzed):
         """Test with minimal code."""
         code = ""
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         exporter = ReportExporter(result)
         assert exporter.to_json()
 
-    def test_analysis_with_error(self):
+    def test_analysis_with_error(self, unified_analyzed):
         """Test export handles analysis errors gracefully."""
         code = "def broken("
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         exporter = ReportExporter(result)
         console = exporter.to_console()
 
         # Should show error
         assert "Error" in console or console.count("Error") >= 1
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_non_ascii_left_unescaped(self, unified_analyzed, indent):
+        """Test that non-ASCII text is emitted as-is for every indent."""
+        result = unified_analyzed("def foo(): return 1", file_path="données.py")
+
+        json_str = ReportExporter(result).to_json(indent=indent)
+
+        assert "données.py" in json_str
+        assert json.loads(json_str)["file_path"] == "données.py"
+
+    def test_non_ascii_written_as_utf8(self, unified_analyzed, tmp_path):
+        """Test that export_report writes non-ASCII output as UTF-8."""
+        result = unified_analyzed("def foo(): return 1", file_path="données.py")
+        output_path = tmp_path / "report.json"
+
+        content = export_report(result, format="json", output_path=str(output_path))
+
+        assert output_path.read_text(encoding="utf-8") == content
+
+    def test_non_string_keys_stringified(self, foo_result):
+        """Test that non-string dict keys serialize like json.dumps does."""
+        result = dataclasses.replace(foo_result, summary={1: "one"})
+
+        data = json.loads(ReportExporter(result).to_json())
+
+        assert data["summary"] == {"1": "one"}
@@ -1,8 +1,9 @@
 """Tests for test generator."""
 
+import ast
+
 import pytest
 
-from backend.models import FunctionInfo
 from backend.synthesis.test_generator import (
     GeneratedTest,
     TestGenerator,
@@ -30,7 +31,7 @@ def add(x, y):
         tests = generate_tests(code, [])
 
         assert len(tests) > 0
-        assert any(t.test_name == "test_add" for t in tests)
+        assert "test_add" in {t.test_name for t in tests}
 
     def test_function_with_optional_param(self):
         """Test edge case generation for Optional parameters."""
@@ -65,7 +66,7 @@ def get_items() -> list:
         tests = generate_tests(code, [])
 
         # Should generate property test
-        assert any(t.test_type == "property" for t in tests)
+        assert "property" in {t.test_type for t in tests}
 
     def test_class_method(self):
         """Test test generation for class methods."""
@@ -155,6 +156,11 @@ class TestTestFileGeneration:
         assert "import pytest" in test_file
 
 
+# Read-only samples for report aggregation tests
+_UNIT_SAMPLE = GeneratedTest("t1", "f1", "c1", "unit", "d1")
+_PROPERTY_SAMPLE = GeneratedTest("t3", "f3", "c3", "property", "d3")
+
+
 class TestTestReport:
     """Test test generation report."""
 
@@ -193,33 +199,35 @@ class TestTestReport:
 
     def test_report_aggregates_by_type(self):
         """Test that report aggregates by test type."""
-        tests = [
-            GeneratedTest("t1", "f1", "c1", "unit", "d1"),
-            GeneratedTest("t2", "f2", "c2", "unit", "d2"),
-            GeneratedTest("t3", "f3", "c3", "property", "d3"),
-        ]
+        # The report only reads its inputs, so one sample can repeat
+        tests = [_UNIT_SAMPLE, _UNIT_SAMPLE, _PROPERTY_SAMPLE]
 
         report = generate_test_report(tests)
 
-        assert report["summary"]["by_type"]["unit"] == 2
-        assert report["summary"]["by_type"]["property"] == 1
+        assert report["summary"]["by_type"] == {"unit": 2, "edge_case": 0, "property": 1}
+        assert len(report["tests"]) == 3
+
+
+@pytest.fixture(scope="class")
+def fresh_generator():
+    """One unvisited generator, shared by the read-only state checks."""
+    return TestGenerator("code")
 
 
 class TestTestGeneratorClass:
     """Test TestGenerator class."""
 
-    def test_initialization(self):
+    @pytest.mark.parametrize("attr,expected", [
+        ("source_code", "code"),
+        ("generated_tests", []),
+    ])
+    def test_initialization(self, fresh_generator, attr, expected):
         """Test generator initialization."""
-        generator = TestGenerator("code")
-
-        assert generator.source_code == "code"
-        assert generator.generated_tests == []
+        assert getattr(fresh_generator, attr) == expected
 
     def test_visits_function(self):
         """Test that generator visits functions."""
         code = "def test(): return 1"
-        import ast
-
         tree = ast.parse(code)
         generator = TestGenerator(code)
         generator.visit(tree)
@@ -245,15 +253,23 @@ class TestGeneratedTestDataclass:
         assert test.test_type == "unit"
         assert test.description == "Test function"
 
+    def test_has_no_instance_dict(self):
+        """Test that slots replace the per-instance __dict__."""
+        test = GeneratedTest("test_func", "func", "def test_func(): pass", "unit", "desc")
+
+        assert not hasattr(test, "__dict__")
+
 
 class TestEdgeCases:
     """Test edge cases."""
 
-    def test_syntax_error_code(self):
-        """Test with syntax error."""
-        tests = generate_tests("def broken(", [])
-
-        assert tests == []
+    @pytest.mark.parametrize("code", [
+        pytest.param("   \n\t\n", id="whitespace_only"),
+        pytest.param("x = 1", id="no_function"),
+    ])
+    def test_no_tests_generated(self, code):
+        """Test that sources without a function definition yield no tests."""
+        assert generate_tests(code, []) == []
 
     def test_function_with_self_param(self):
         """Test that 'self' parameter is excluded from test generation."""
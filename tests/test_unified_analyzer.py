@@ -1,77 +1,37 @@
 """Tests for unified analyzer."""
 
+import hashlib
+
 import pytest
 
 from backend.analysis.unified_analyzer import (
     AnalysisResult,
-    UnifiedAnalyzer,
     analyze_code,
 )
 
 
-class TestUnifiedAnalyzer:
-    """Test the unified analyzer."""
-
-    def test_empty_code(self):
-        """Test with empty code."""
-        result = analyze_code("")
+# Snippets shared by several tests, so memoized analyses are reused
+_FOO_SRC = "def foo(): return 1"
 
-        assert result.analysis_id
-        assert result.language == "python"
-        assert isinstance(result.summary, dict)
-
-    def test_simple_function_analysis(self):
-        """Test analysis of simple function."""
-        code = """
-def add(x, y):
-    return x + y
-"""
-        result = analyze_code(code)
-
-        assert result.structure is not None
-        assert len(result.structure.functions) == 1
-        assert result.structure.functions[0].name == "add"
-
-    def test_logic_issues_detection(self):
-        """Test that logic issues are detected."""
-        code = """
+_DIVIDE_SRC = """
 def divide(x, y):
     return x / y
 """
-        result = analyze_code(code)
 
-        # Should detect division by zero risk
-        assert isinstance(result.logic_issues, list)
-        assert any(i.get("type") == "division_by_zero_risk" for i in result.logic_issues)
-
-    def test_security_issues_detection(self):
-        """Test that security issues are detected."""
-        code = """
+_SQL_FORMAT_SRC = """
 def query(user_id):
     sql = "SELECT * FROM users WHERE id = %s" % user_id
     return sql
 """
-        result = analyze_code(code)
-
-        # Should detect SQL injection risk
-        assert isinstance(result.security_issues, list)
 
-    def test_performance_issues_detection(self):
-        """Test that performance issues are detected."""
-        code = """
+_NESTED_LOOP_SRC = """
 def nested_loop(items):
     for x in items:
         for y in items:
             pass
 """
-        result = analyze_code(code)
-
-        # Should detect O(n²) pattern
-        assert isinstance(result.performance_issues, list)
 
-    def test_maintainability_issues_detection(self):
-        """Test that maintainability issues are detected."""
-        code = """
+_LONG_FUNCTION_SRC = """
 def long_function():
     x = 1
     x = 2
@@ -79,12 +39,81 @@ def long_function():
     return x
 """ + "\n    x = {}\n" * 35
 
-        result = analyze_code(code)
+# A.run has eleven branches (complexity 12); B.run is trivial (complexity 1)
+_SAME_NAMED_METHODS_SRC = (
+    "\nclass A:\n    def run(self, x):\n"
+    + "\n".join(f"        if x == {i}:\n            return {i}" for i in range(11))
+    + "\n        return 0\n\nclass B:\n    def run(self):\n        return 1\n"
+)
+
+# Edge-case snippets, each defining a single function
+_UNICODE_SRC = """
+def greet(name):
+    return f"Hello, {name} 🎉"
+"""
+
+_MULTILINE_STRING_SRC = '''
+def get_doc():
+    """
+    This is a multiline
+    docstring.
+    """
+    pass
+'''
+
+_DECORATOR_SRC = """
+from functools import lru_cache
+
+@lru_cache(maxsize=128)
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n-1) + fib(n-2)
+"""
+
+
+class TestUnifiedAnalyzer:
+    """Test the unified analyzer.
+
+    Tests that only inspect structure or result metadata pass
+    skip_patterns=True, since pattern detection does not affect them.
+    """
 
-        # Should detect long function
-        assert any(i.get("type") == "long_function" for i in result.maintainability_issues)
+    def test_empty_code(self, unified_analyzed):
+        """Test with empty code."""
+        result = unified_analyzed("")
 
-    def test_complexity_metrics(self):
+        assert result.analysis_id
+        assert result.language == "python"
+        assert isinstance(result.summary, dict)
+
+    def test_simple_function_analysis(self, unified_analyzed):
+        """Test analysis of simple function."""
+        code = """
+def add(x, y):
+    return x + y
+"""
+        result = unified_analyzed(code, skip_patterns=True)
+
+        assert result.structure is not None
+        assert len(result.structure.functions) == 1
+        assert result.structure.functions[0].name == "add"
+
+    @pytest.mark.parametrize("code,attr,issue_type", [
+        pytest.param(_DIVIDE_SRC, "logic_issues", "division_by_zero_risk", id="logic"),
+        pytest.param(_SQL_FORMAT_SRC, "security_issues", "sql_injection", id="security"),
+        pytest.param(_NESTED_LOOP_SRC, "performance_issues", "o_n_squared", id="performance"),
+        pytest.param(
+            _LONG_FUNCTION_SRC, "maintainability_issues", "long_function", id="maintainability"
+        ),
+    ])
+    def test_issue_detection(self, unified_analyzed, code, attr, issue_type):
+        """Test that each critic's issue reaches its result category."""
+        issues = getattr(unified_analyzed(code), attr)
+
+        assert issue_type in {i.get("type") for i in issues}
+
+    def test_complexity_metrics(self, unified_analyzed):
         """Test complexity metrics calculation."""
         code = """
 def complex_func(x):
@@ -96,82 +125,84 @@ def complex_func(x):
     else:
         return 3
 """
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         assert "total_functions" in result.complexity_metrics
         assert result.complexity_metrics["total_functions"] >= 1
+        assert result.complexity_metrics["functions_analyzed"] == 1
+        assert result.complexity_metrics["avg_cyclomatic_complexity"] == 3
+
+    def test_complexity_of_same_named_methods(self, unified_analyzed):
+        """Test that methods sharing a name are measured separately."""
+        result = unified_analyzed(_SAME_NAMED_METHODS_SRC, skip_patterns=True)
 
-    def test_summary_generation(self):
+        metrics = result.complexity_metrics
+        assert metrics["functions_analyzed"] == 2
+        assert metrics["avg_cyclomatic_complexity"] == (12 + 1) / 2
+        assert metrics["high_complexity_functions"] == [{"name": "run", "complexity": 12}]
+
+    def test_summary_generation(self, unified_analyzed):
         """Test summary generation."""
-        code = """
-def foo():
-    return 1
-"""
-        result = analyze_code(code)
+        result = unified_analyzed(_FOO_SRC)
 
-        assert "total_issues" in result.summary
-        assert "by_severity" in result.summary
-        assert "by_category" in result.summary
+        assert result.summary.keys() >= {"total_issues", "by_severity", "by_category"}
 
-    def test_syntax_error_handling(self):
+    def test_syntax_error_handling(self, unified_analyzed):
         """Test handling of syntax errors."""
         code = "def broken("
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         # Should handle gracefully
         assert result.summary.get("error") or result.summary == {"error": "Syntax error in source code"}
 
-    def test_skip_patterns_flag(self):
+    def test_skip_patterns_flag(self, unified_analyzed):
         """Test skip_patterns flag."""
         code = """
 class Singleton:
     _instance = None
 """
-        result = analyze_code(code, skip_patterns=True)
+        result = unified_analyzed(code, skip_patterns=True)
 
         # Patterns should be empty or minimal when skipped
         assert isinstance(result.design_patterns, list)
 
     def test_analysis_id_unique(self):
         """Test that each analysis gets a unique ID."""
-        code = "def foo(): return 1"
+        code = _FOO_SRC
 
-        result1 = analyze_code(code)
-        result2 = analyze_code(code)
+        result1 = analyze_code(code, skip_patterns=True)
+        result2 = analyze_code(code, skip_patterns=True)
 
         assert result1.analysis_id != result2.analysis_id
 
-    def test_code_hash_consistent(self):
-        """Test that code hash is consistent."""
-        code = "def foo(): return 1"
+    def test_code_hash_consistent(self, unified_analyzed):
+        """Test that code hash is the SHA-256 of the source."""
+        result = unified_analyzed(_FOO_SRC, skip_patterns=True)
 
-        result1 = analyze_code(code)
-        result2 = analyze_code(code)
+        assert result.code_hash == hashlib.sha256(_FOO_SRC.encode()).hexdigest()
 
-        assert result1.code_hash == result2.code_hash
-
-    def test_file_path_recorded(self):
+    def test_file_path_recorded(self, unified_analyzed):
         """Test that file path is recorded."""
-        code = "def foo(): return 1"
+        code = _FOO_SRC
 
-        result = analyze_code(code, file_path="test.py")
+        result = unified_analyzed(code, file_path="test.py", skip_patterns=True)
 
         assert result.file_path == "test.py"
 
-    def test_class_analysis(self):
+    def test_class_analysis(self, unified_analyzed):
         """Test class analysis."""
         code = """
 class MyClass:
     def method(self):
         return 1
 """
-        result = analyze_code(code)
+        result = unified_analyzed(code, skip_patterns=True)
 
         assert result.structure is not None
         assert len(result.structure.classes) == 1
         assert result.structure.classes[0].name == "MyClass"
 
-    def test_security_boundaries_analysis(self):
+    def test_security_boundaries_analysis(self, unified_analyzed):
         """Test security boundary analysis."""
         code = """
 from flask import request
@@ -180,7 +211,7 @@ def process():
     user_input = request.args.get('data')
     return user_input
 """
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         # Should detect input boundaries
         assert isinstance(result.input_boundaries, list)
@@ -207,50 +238,23 @@ class TestAnalysisResult:
 class TestEdgeCases:
     """Test edge cases."""
 
-    def test_unicode_in_code(self):
-        """Test handling of unicode characters."""
-        code = """
-def greet(name):
-    return f"Hello, {name} 🎉"
-"""
-        result = analyze_code(code)
-
-        assert isinstance(result, AnalysisResult)
-
-    def test_multiline_string(self):
-        """Test handling of multiline strings."""
-        code = '''
-def get_doc():
-    """
-    This is a multiline
-    docstring.
-    """
-    pass
-'''
-        result = analyze_code(code)
-
-        assert isinstance(result, AnalysisResult)
-
-    def test_decorator_handling(self):
-        """Test handling of decorated functions."""
-        code = """
-from functools import lru_cache
-
-@lru_cache(maxsize=128)
-def fib(n):
-    if n < 2:
-        return n
-    return fib(n-1) + fib(n-2)
-"""
-        result = analyze_code(code)
+    @pytest.mark.parametrize("code,function_name", [
+        pytest.param(_UNICODE_SRC, "greet", id="unicode"),
+        pytest.param(_MULTILINE_STRING_SRC, "get_doc", id="multiline_string"),
+        pytest.param(_DECORATOR_SRC, "fib", id="decorator"),
+    ])
+    def test_analyze_returns_result(self, unified_analyzed, code, function_name):
+        """Test that unusual but valid snippets parse into one function."""
+        result = unified_analyzed(code, skip_patterns=True)
 
         assert isinstance(result, AnalysisResult)
+        assert [f.name for f in result.structure.functions] == [function_name]
 
 
 class TestIntegration:
     """Test integration with all analysis modules."""
 
-    def test_full_analysis_integration(self):
+    def test_full_analysis_integration(self, unified_analyzed):
         """Test that all analysis modules work together."""
         code = """
 class DataProcessor:
@@ -267,13 +271,12 @@ class DataProcessor:
         with open(filename, 'w') as f:
             f.write(str(self.data))
 """
-        result = analyze_code(code)
+        result = unified_analyzed(code)
 
         # All categories should be analyzed
-        assert "logic" in result.summary["by_category"]
-        assert "security" in result.summary["by_category"]
-        assert "performance" in result.summary["by_category"]
-        assert "maintainability" in result.summary["by_category"]
+        assert result.summary["by_category"].keys() >= {
+            "logic", "security", "performance", "maintainability"
+        }
 
         # Should detect various issues
         total_issues = result.summary["total_issues"]
@@ -1,8 +1,14 @@
 """Tests for visualization module."""
 
+import ast
+import re
+from collections import Counter
+
 import pytest
 
-from backend.analysis.unified_analyzer import analyze_code
+from backend.analysis import cfg as cfg_module
+from backend.analysis.cfg import get_function_cfg
+from backend.analysis.common import parse_cached
 from backend.parsing.visualization import (
     VisualizationGenerator,
     generate_dot_cfg,
@@ -11,20 +17,33 @@ from backend.parsing.visualization import (
 )
 
 
-class TestVisualizationGenerator:
-    """Test VisualizationGenerator class."""
+# Header tokens each DOT rendering must contain, matched in one scan
+_CALL_GRAPH_RE = re.compile(r"digraph call_graph|rankdir=TB")
+_DEPENDENCY_GRAPH_RE = re.compile(r"digraph dependencies|rankdir=LR")
+_CFG_RE = re.compile(r"digraph cfg|entry|exit")
+_CC_LABEL_RE = re.compile(r'"(\w+)" \[label="\1\\n\(\d+ CC\)"\]')
 
-    def test_init(self):
-        """Test initialization with AnalysisResult."""
-        code = "def foo(): return 1"
-        result = analyze_code(code)
 
-        gen = VisualizationGenerator(result)
-        assert gen.result == result
+def _found(pattern, text):
+    """Return the distinct tokens of pattern that occur in text."""
+    return set(pattern.findall(text))
+
+
+# Snippets shared by several tests, so memoized analyses are reused
+_FOO_SRC = "def foo(): return 1"
+
+_DIVIDE_SRC = """
+def divide(x, y):
+    return x / y
+"""
+
+# Exercises every view generate_visualizations builds: calls, imports,
+# branching complexity and detectable issues
+_CALLS_AND_DEPS_SRC = """
+import os
+import sys
+from typing import List
 
-    def test_generate_call_graph_dot(self):
-        """Test call graph DOT generation."""
-        code = """
 def main():
     foo()
 
@@ -33,106 +52,63 @@ def foo():
 
 def bar():
     pass
-"""
-        result = analyze_code(code)
-        gen = VisualizationGenerator(result)
-
-        dot = gen.generate_call_graph_dot()
-
-        assert isinstance(dot, str)
-        assert "digraph call_graph" in dot
-        assert "rankdir=TB" in dot
 
-    def test_generate_call_graph_with_complexity(self):
-        """Test call graph includes complexity info."""
-        code = """
-def complex_func():
+def high_complexity(x, y, z):
     if x:
         if y:
             if z:
-                return 1
+                for i in range(10):
+                    if i > 5:
+                        return x + y
     return 0
-
-def simple_func():
-    return 1
+""" + _DIVIDE_SRC + """
+def insecure():
+    sql = "SELECT * FROM users WHERE id = %s" % user_input
+    return sql
 """
-        result = analyze_code(code)
-        gen = VisualizationGenerator(result)
 
-        dot = gen.generate_call_graph_dot()
+# Stress inputs, built once at import
+_MANY_FUNCTIONS_SRC = "\n".join(f"def func{i}(): return {i}" for i in range(50))
+_LONG_NAME_SRC = f"def {'a' * 200}(): return 1"
+_UNICODE_NAME_SRC = "def émoji_😀(): return 1"
 
-        # Should show complexity in labels
-        assert "CC" in dot or dot.count("node") >= 0
 
-    def test_generate_dependency_graph_dot(self):
-        """Test dependency graph DOT generation."""
-        code = """
-import os
-import sys
-from typing import List
-
-def foo():
-    pass
-"""
-        result = analyze_code(code)
-        gen = VisualizationGenerator(result)
+class TestVisualizationGenerator:
+    """Test VisualizationGenerator class."""
 
-        dot = gen.generate_dependency_graph_dot()
+    def test_init(self, unified_analyzed):
+        """Test initialization with AnalysisResult."""
+        result = unified_analyzed(_FOO_SRC)
 
-        assert isinstance(dot, str)
-        assert "digraph dependencies" in dot
-        assert "rankdir=LR" in dot
+        gen = VisualizationGenerator(result)
+        assert gen.result == result
 
-    def test_generate_complexity_heatmap(self):
-        """Test complexity heatmap generation."""
+    def test_generate_call_graph_with_complexity(self, unified_analyzed):
+        """Test call graph includes complexity info."""
         code = """
-def low_complexity():
-    return 1
-
-def high_complexity(x, y, z):
+def complex_func():
     if x:
         if y:
             if z:
-                for i in range(10):
-                    if i > 5:
-                        return x + y
+                return 1
     return 0
-"""
-        result = analyze_code(code)
-        gen = VisualizationGenerator(result)
-
-        heatmap = gen.generate_complexity_heatmap()
 
-        assert isinstance(heatmap, dict)
-        assert "functions" in heatmap
-        assert "max_complexity" in heatmap
-        assert isinstance(heatmap["functions"], list)
-        assert isinstance(heatmap["max_complexity"], int)
-
-    def test_generate_issues_by_line(self):
-        """Test issues per line generation."""
-        code = """
-def divide(x, y):
-    return x / y
-
-def insecure():
-    sql = "SELECT * FROM users WHERE id = %s" % user_input
-    return sql
+def simple_func():
+    return 1
 """
-        result = analyze_code(code)
+        result = unified_analyzed(code)
         gen = VisualizationGenerator(result)
 
-        line_issues = gen.generate_issues_by_line()
+        dot = gen.generate_call_graph_dot()
 
-        assert isinstance(line_issues, dict)
-        # Line numbers should be int keys
-        for line in line_issues.keys():
-            assert isinstance(line, int)
+        # Every function node carries its complexity in the label
+        labelled = {m.group(1) for m in _CC_LABEL_RE.finditer(dot)}
+        assert labelled == {"complex_func", "simple_func"}
 
-    def test_heatmap_with_no_functions(self):
+    def test_heatmap_with_no_functions(self, unified_analyzed):
         """Test heatmap with empty code."""
         code = ""
-        result = analyze_code(code)
+        result = unified_analyzed(code)
         gen = VisualizationGenerator(result)
 
         heatmap = gen.generate_complexity_heatmap()
@@ -146,14 +122,10 @@ class TestGenerateDotCfg:
 
     def test_generate_dot_cfg_simple(self):
         """Test CFG generation for simple function."""
-        code = """
-def foo():
-    return 1
-"""
-        dot = generate_dot_cfg(code, "foo")
+        dot = generate_dot_cfg(_FOO_SRC, "foo")
 
-        assert isinstance(dot, str)
-        assert "digraph" in dot
+        assert dot.startswith("digraph cfg {")
+        assert "entry_foo" in dot
 
     def test_generate_dot_cfg_with_branch(self):
         """Test CFG generation for branching function."""
@@ -166,122 +138,105 @@ def branch(x):
 """
         dot = generate_dot_cfg(code, "branch")
 
-        assert isinstance(dot, str)
-        assert "digraph" in dot
+        assert dot.startswith("digraph cfg {")
+        assert "entry_branch" in dot
+        assert dot.count("[label=\"return\"]") == 2
+
+    def test_generate_dot_cfg_reuses_cached_tree(self, monkeypatch):
+        """Test that a source already parsed is not parsed again."""
+        parse_cached(_FOO_SRC)
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("ast.parse called for a cached source")
 
-    def test_generate_dot_cfg_function_not_found(self):
-        """Test CFG generation when function doesn't exist."""
-        code = "def foo(): return 1"
-        dot = generate_dot_cfg(code, "nonexistent")
+        monkeypatch.setattr(ast, "parse", fail_parse)
 
-        # Should return fallback DOT
-        assert isinstance(dot, str)
-        assert "digraph" in dot
+        assert "entry_foo" in generate_dot_cfg(_FOO_SRC, "foo")
 
-    def test_generate_dot_cfg_invalid_syntax(self):
-        """Test CFG generation with invalid syntax."""
-        code = "def broken(\n"
-        dot = generate_dot_cfg(code, "broken")
+    @pytest.mark.parametrize("code,function_name", [
+        pytest.param(_FOO_SRC, "nonexistent", id="function_not_found"),
+        pytest.param("def broken(\n", "broken", id="invalid_syntax"),
+    ])
+    def test_generate_dot_cfg_fallback(self, code, function_name):
+        """Test that a missing function or bad source yields the fallback DOT."""
+        dot = generate_dot_cfg(code, function_name)
 
-        # Should return fallback DOT
-        assert isinstance(dot, str)
+        assert dot.startswith(f"digraph cfg_{function_name}")
 
 
 class TestVisualizeCfgDot:
     """Test visualize_cfg_dot function."""
 
+    def test_reexports_cfg_renderer(self):
+        """Test that the visualization module shares the CFG module's renderer."""
+        assert visualize_cfg_dot is cfg_module.visualize_cfg_dot
+
     def test_visualize_cfg_dot_basic(self):
         """Test basic CFG visualization."""
-        # Create a mock CFG object
-        class MockCFG:
-            entry_id = "entry"
-            exit_id = "exit"
-
-        cfg = MockCFG()
+        cfg = get_function_cfg(_FOO_SRC, "foo")
         dot = visualize_cfg_dot(cfg)
 
-        assert isinstance(dot, str)
-        assert "digraph cfg" in dot
-        assert "entry" in dot
-        assert "exit" in dot
+        assert _found(_CFG_RE, dot) == {"digraph cfg", "entry", "exit"}
+        assert cfg.entry_node in dot
 
 
 class TestGenerateVisualizations:
     """Test generate_visualizations convenience function."""
 
-    def test_generate_all_visualizations(self):
-        """Test generating all visualizations at once."""
-        code = """
-def foo(x, y):
-    if x > 0:
-        return x / y
-    return 0
-
-def bar():
-    foo(1, 2)
-"""
-        result = analyze_code(code)
+    def test_generate_all_visualizations(self, unified_analyzed):
+        """Test that one generate_visualizations call yields every view."""
+        result = unified_analyzed(_CALLS_AND_DEPS_SRC)
         viz = generate_visualizations(result)
 
-        assert isinstance(viz, dict)
-        assert "call_graph_dot" in viz
-        assert "dependency_graph_dot" in viz
-        assert "complexity_heatmap" in viz
-        assert "issues_by_line" in viz
-
-    def test_visualizations_with_empty_code(self):
-        """Test visualizations with empty code."""
-        code = ""
-        result = analyze_code(code)
-        viz = generate_visualizations(result)
-
-        assert viz["call_graph_dot"]
-        assert viz["dependency_graph_dot"]
-        assert isinstance(viz["issues_by_line"], dict)
-
-    def test_visualizations_with_issues(self):
-        """Test visualizations include issue data."""
-        code = """
-def divide(x, y):
-    return x / y
-
-def insecure():
-    exec(user_input)
-"""
-        result = analyze_code(code)
-        viz = generate_visualizations(result)
+        assert viz.keys() >= {
+            "call_graph_dot", "dependency_graph_dot", "complexity_heatmap", "issues_by_line"
+        }
+        assert _found(_CALL_GRAPH_RE, viz["call_graph_dot"]) == {
+            "digraph call_graph", "rankdir=TB"
+        }
+        assert _found(_DEPENDENCY_GRAPH_RE, viz["dependency_graph_dot"]) == {
+            "digraph dependencies", "rankdir=LR"
+        }
+
+        heatmap = viz["complexity_heatmap"]
+        assert heatmap.keys() >= {"functions", "max_complexity"}
+        assert isinstance(heatmap["functions"], list)
+        assert isinstance(heatmap["max_complexity"], int)
 
-        # issues_by_line should be populated
-        assert isinstance(viz["issues_by_line"], dict)
+        # Every reported issue is counted on its line, including the division
+        issues = (
+            result.logic_issues + result.security_issues
+            + result.performance_issues + result.maintainability_issues
+        )
+        assert viz["issues_by_line"] == Counter(issue["line"] for issue in issues)
+        division_lines = {
+            issue["line"] for issue in result.logic_issues
+            if issue["type"] == "division_by_zero_risk"
+        }
+        assert division_lines and division_lines <= viz["issues_by_line"].keys()
 
 
 class TestVisualizationEdgeCases:
     """Test edge cases for visualization."""
 
-    def test_unicode_in_function_names(self):
-        """Test visualization with unicode characters."""
-        code = "def émoji_😀(): return 1"
-        result = analyze_code(code)
-        gen = VisualizationGenerator(result)
-
-        dot = gen.generate_call_graph_dot()
-        assert isinstance(dot, str)
-
-    def test_very_long_function_name(self):
-        """Test visualization with very long function names."""
-        long_name = "a" * 200
-        code = f"def {long_name}(): return 1"
-        result = analyze_code(code)
-        gen = VisualizationGenerator(result)
-
-        dot = gen.generate_call_graph_dot()
-        assert isinstance(dot, str)
+    @pytest.mark.parametrize("code", [
+        pytest.param("", id="empty_code"),
+        pytest.param(_UNICODE_NAME_SRC, id="unicode_function_name"),
+        pytest.param(_LONG_NAME_SRC, id="very_long_function_name"),
+    ])
+    def test_visualizations_smoke(self, unified_analyzed, code):
+        """Test that edge-case inputs still render every view."""
+        viz = generate_visualizations(unified_analyzed(code))
+
+        assert viz["call_graph_dot"].startswith("digraph call_graph")
+        assert viz["dependency_graph_dot"].startswith("digraph dependencies")
+        assert isinstance(viz["issues_by_line"], dict)
 
-    def test_many_functions(self):
+    def test_many_functions(self, unified_analyzed):
         """Test visualization with many functions."""
-        code = "\n".join([f"def func{i}(): return {i}" for i in range(50)])
-        result = analyze_code(code)
+        result = unified_analyzed(_MANY_FUNCTIONS_SRC)
         gen = VisualizationGenerator(result)
 
         heatmap = gen.generate_complexity_heatmap()
         assert len(heatmap["functions"]) == 50
+        assert result.complexity_metrics["functions_analyzed"] == 50